@@ -1,14 +1,13 @@
 #!/usr/bin/env python3
 """SkyProject entry point - PM AI plans, IrgatAI builds, both evolve."""
+from __future__ import annotations
+
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from skyproject.core.orchestrator import Orchestrator
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -60,12 +59,16 @@ Examples:
         from skyproject.core.config import Config
         Config.AUTO_IMPROVE = False
 
+    from skyproject.cli import _install_fast_loop, _run_n_cycles, run_async
+    from skyproject.core.orchestrator import Orchestrator
+
     orchestrator = Orchestrator()
+    _install_fast_loop()
 
     if args.cycles > 0:
-        asyncio.run(_run_n_cycles(orchestrator, args.cycles))
+        run_async(_run_n_cycles(orchestrator, args.cycles))
     else:
-        asyncio.run(orchestrator.run())
+        run_async(orchestrator.run())
 
 
 def _run_init(target_dir: str | None) -> None:
@@ -74,6 +77,7 @@ def _run_init(target_dir: str | None) -> None:
 
     bootstrap = Bootstrap(target_dir=target_dir)
     profile = bootstrap.run()
+    bootstrap.wait_for_index()
 
     from rich.console import Console
     console = Console()
@@ -81,29 +85,5 @@ def _run_init(target_dir: str | None) -> None:
     console.print(f"[dim]Run 'python run.py' to start the evolution loop.[/dim]")
 
 
-async def _run_n_cycles(orchestrator: Orchestrator, n: int):
-    """Run exactly N cycles then stop."""
-    from rich.console import Console
-    console = Console()
-    orchestrator._print_banner()
-
-    for i in range(n):
-        result = await orchestrator.run_single_cycle()
-        orchestrator.state.cycle_count += 1
-
-        pm_actions = len(result.get("pm", {}).get("actions", []))
-        irgat_actions = len(result.get("irgat", {}).get("actions", []))
-        console.print(
-            f"\n[dim]Cycle {i + 1}/{n} complete. "
-            f"PM: {pm_actions} actions, Irgat: {irgat_actions} actions[/dim]"
-        )
-
-        if i < n - 1:
-            from skyproject.core.config import Config
-            await asyncio.sleep(Config.CYCLE_INTERVAL)
-
-    console.print(f"\n[bold green]Completed {n} cycles.[/bold green]")
-
-
 if __name__ == "__main__":
     main()
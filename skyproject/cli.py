@@ -1,4 +1,9 @@
-"""SkyProject CLI — entry point for `skyproject` command."""
+"""SkyProject CLI — entry point for `skyproject` command.
+
+Heavy dependencies (rich, uvicorn, the orchestrator stack, the Telegram bot) are imported
+inside the subcommand that needs them so `--help` and `status` stay fast. Check with
+`PYTHONPROFILEIMPORTTIME=1 skyproject --help` before adding module-level imports here.
+"""
 from __future__ import annotations
 
 import argparse
@@ -15,6 +20,8 @@ def main():
 Examples:
   skyproject init                       # Bootstrap: detect, install, index
   skyproject init /path/to/project      # Bootstrap targeting another project
+  skyproject init --force-reinstall     # Re-run pip even if requirements are unchanged
+  skyproject init --wait-index          # Finish vector indexing before returning
   skyproject run                        # Continuous evolution loop
   skyproject run --cycles 5             # Run exactly 5 cycles
   skyproject run --no-self-improve      # Disable self-improvement
@@ -29,6 +36,12 @@ Examples:
     # init
     init_p = subparsers.add_parser("init", help="Bootstrap and initialize SkyProject")
     init_p.add_argument("target", nargs="?", default=None, help="Target project directory")
+    init_p.add_argument(
+        "--force-reinstall", action="store_true", help="Reinstall dependencies even if unchanged"
+    )
+    init_p.add_argument(
+        "--wait-index", action="store_true", help="Block until the codebase index is built"
+    )
 
     # run
     run_p = subparsers.add_parser("run", help="Start the evolution loop")
@@ -53,7 +66,7 @@ Examples:
         sys.exit(0)
 
     if args.command == "init":
-        _cmd_init(args.target)
+        _cmd_init(args.target, force_reinstall=args.force_reinstall, wait_index=args.wait_index)
     elif args.command == "run":
         _cmd_run(args)
     elif args.command == "web":
@@ -62,22 +75,23 @@ Examples:
         _cmd_status()
 
 
-def _cmd_init(target_dir: str | None) -> None:
+def _cmd_init(target_dir: str | None, force_reinstall: bool = False, wait_index: bool = False) -> None:
     from skyproject.core.bootstrap import Bootstrap
     from rich.console import Console
 
-    bootstrap = Bootstrap(target_dir=target_dir)
+    bootstrap = Bootstrap(target_dir=target_dir, force_reinstall=force_reinstall, wait_index=wait_index)
     bootstrap.run()
+    bootstrap.wait_for_index()
 
     Console().print("\n[bold green]Ready! Run 'skyproject run' to start.[/bold green]")
 
 
 def _cmd_run(args) -> None:
     import os
-    import threading
     from skyproject.core.config import Config
+
+    _install_fast_loop()
     from skyproject.core.orchestrator import Orchestrator
-    from skyproject.telegram.bot import SkyTelegramBot
 
     if args.interval is not None:
         Config.CYCLE_INTERVAL = args.interval
@@ -85,16 +99,50 @@ def _cmd_run(args) -> None:
         Config.AUTO_IMPROVE = False
 
     orchestrator = Orchestrator()
-    orchestrator.telegram_bot = SkyTelegramBot(orchestrator)
+    if Config.TELEGRAM_BOT_TOKEN and Config.TELEGRAM_CHAT_ID:
+        from skyproject.telegram.bot import SkyTelegramBot
+        orchestrator.telegram_bot = SkyTelegramBot(orchestrator)
 
     if getattr(args, "web", False) or os.getenv("SKY_WEB_ENABLED", "").lower() == "true":
         port = getattr(args, "web_port", None) or int(os.getenv("SKY_WEB_PORT", "8080"))
         _start_web_background(orchestrator, port)
 
     if args.cycles > 0:
-        asyncio.run(_run_n_cycles(orchestrator, args.cycles))
+        run_async(_run_n_cycles(orchestrator, args.cycles))
     else:
-        asyncio.run(orchestrator.run())
+        run_async(orchestrator.run())
+
+
+def _install_fast_loop() -> bool:
+    """Switch to uvloop (winloop on Windows) when SKY_FAST_LOOP=1 and it is installed."""
+    import os
+
+    if os.getenv("SKY_FAST_LOOP", "") not in ("1", "true"):
+        return False
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+    return True
+
+
+def run_async(coro) -> None:
+    """Run a coroutine to completion, opting into eager task execution on Python 3.12+."""
+    if sys.version_info < (3, 12) or not hasattr(asyncio, "eager_task_factory"):
+        asyncio.run(coro)
+        return
+
+    def _eager_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(asyncio.eager_task_factory)
+        return loop
+
+    with asyncio.Runner(loop_factory=_eager_loop) as runner:
+        runner.run(coro)
 
 
 def _cmd_web(args) -> None:
@@ -132,28 +180,35 @@ def _start_web_background(orchestrator, port: int = 8080) -> None:
 
 def _cmd_status() -> None:
     import json
+    import os
     from pathlib import Path
-    from rich.console import Console
-    from rich.table import Table
 
-    console = Console()
     data_dir = Path(__file__).parent.parent / "data"
 
     config_file = data_dir / "project_config.json"
     if config_file.exists():
-        profile = json.loads(config_file.read_text())
+        from rich.console import Console
+
+        console = Console()
+        try:
+            import orjson
+
+            profile = orjson.loads(config_file.read_bytes())
+        except ImportError:
+            profile = json.loads(config_file.read_text())
         console.print(f"[bold]Project:[/bold] {profile.get('project_dir', 'unknown')}")
         console.print(f"[bold]Language:[/bold] {profile.get('primary_language', 'unknown')}")
         console.print(f"[bold]Frameworks:[/bold] {', '.join(profile.get('frameworks', [])) or 'none'}")
         console.print(f"[bold]Source files:[/bold] {profile.get('file_count', 0)}")
     else:
-        console.print("[yellow]Not initialized. Run 'skyproject init' first.[/yellow]")
+        print("Not initialized. Run 'skyproject init' first.")
         return
 
     tasks_dir = data_dir / "tasks"
     if tasks_dir.exists():
-        task_files = list(tasks_dir.glob("*.json"))
-        console.print(f"[bold]Tasks:[/bold] {len(task_files)}")
+        with os.scandir(tasks_dir) as it:
+            task_count = sum(1 for e in it if e.name.endswith(".json") and e.is_file(follow_symlinks=False))
+        console.print(f"[bold]Tasks:[/bold] {task_count}")
 
     vector_dir = data_dir / "vector_db"
     if vector_dir.exists():
@@ -165,6 +220,7 @@ async def _run_n_cycles(orchestrator, n: int):
     from skyproject.core.config import Config
 
     console = Console()
+    interval = Config.CYCLE_INTERVAL
     orchestrator._print_banner()
 
     for i in range(n):
@@ -179,6 +235,6 @@ async def _run_n_cycles(orchestrator, n: int):
         )
 
         if i < n - 1:
-            await asyncio.sleep(Config.CYCLE_INTERVAL)
+            await asyncio.sleep(interval)
 
     console.print(f"\n[bold green]Completed {n} cycles.[/bold green]")
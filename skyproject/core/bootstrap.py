@@ -1,18 +1,36 @@
 """Bootstrap layer - auto-detects environment, installs deps, configures, and starts the system."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
 from rich.panel import Panel
 
+# orjson is preferred for speed; fall back to the stdlib if it is not installed yet.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -47,6 +65,14 @@ class ProjectDetector:
         },
     }
 
+    EXT_TO_LANG = {ext: lang for lang, sigs in LANG_SIGNATURES.items() for ext in sigs["extensions"]}
+    # A manifest can signal several languages (package.json -> javascript and typescript).
+    SIG_FILE_TO_LANGS: dict[str, tuple[str, ...]] = {}
+    for _lang, _sigs in LANG_SIGNATURES.items():
+        for _sig_file in _sigs["files"]:
+            SIG_FILE_TO_LANGS[_sig_file] = SIG_FILE_TO_LANGS.get(_sig_file, ()) + (_lang,)
+    del _lang, _sigs, _sig_file
+
     FRAMEWORK_SIGNATURES = {
         "django": ["manage.py", "settings.py"],
         "flask": ["app.py"],
@@ -56,11 +82,33 @@ class ProjectDetector:
         "express": ["server.js", "app.js"],
     }
 
+    FRAMEWORK_PACKAGES = {
+        "react": "react",
+        "vue": "vue",
+        "angular": "@angular/core",
+        "svelte": "svelte",
+        "express": "express",
+        "nextjs": "next",
+        "nuxt": "nuxt",
+    }
+
+    TEST_DIRS = ("tests", "test", "__tests__", "spec")
+    CI_MARKERS = (".gitlab-ci.yml", "Jenkinsfile", ".circleci")
+
+    DEFAULT_SOURCE_EXTENSIONS = frozenset({".py", ".js", ".ts", ".go", ".rs", ".java"})
+
+    # Directories never worth descending into when counting source files.
+    SKIP_DIRS = frozenset({"__pycache__", "node_modules", "venv", ".venv", "target", "dist", "build"})
+
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir
+        self._scan_result: Optional[ScanResult] = None
+        self._pkg_deps: Optional[dict] = None
 
     def detect(self) -> dict:
         """Return a full project profile."""
+        # file_count always needs the deep walk, so do it up front rather than listing the root twice.
+        scan = self._scan()
         languages = self._detect_languages()
         frameworks = self._detect_frameworks()
         structure = self._detect_structure()
@@ -71,102 +119,166 @@ class ProjectDetector:
             "primary_language": languages[0] if languages else "unknown",
             "frameworks": frameworks,
             "structure": structure,
-            "has_git": (self.project_dir / ".git").exists(),
-            "has_tests": any(
-                (self.project_dir / d).exists()
-                for d in ["tests", "test", "__tests__", "spec"]
-            ),
-            "has_ci": any(
-                (self.project_dir / f).exists()
-                for f in [".github/workflows", ".gitlab-ci.yml", "Jenkinsfile", ".circleci"]
-            ),
+            "has_git": scan.has_git,
+            "has_tests": scan.has_tests,
+            "has_ci": scan.has_ci,
             "file_count": self._count_source_files(languages),
         }
 
     def _detect_languages(self) -> list[str]:
-        detected = []
-        for lang, sigs in self.LANG_SIGNATURES.items():
-            for sig_file in sigs["files"]:
-                if (self.project_dir / sig_file).exists():
-                    if lang not in detected:
-                        detected.append(lang)
-                    break
-
-        if not detected:
-            ext_counts: dict[str, int] = {}
-            for f in self.project_dir.rglob("*"):
-                if f.is_file() and not any(p.startswith(".") for p in f.parts):
-                    ext_counts[f.suffix] = ext_counts.get(f.suffix, 0) + 1
+        scan = self._scan(deep=False)
+        found = {lang for name in scan.top_names for lang in self.SIG_FILE_TO_LANGS.get(name, ())}
 
-            for lang, sigs in self.LANG_SIGNATURES.items():
-                for ext in sigs["extensions"]:
-                    if ext_counts.get(ext, 0) > 3:
-                        if lang not in detected:
-                            detected.append(lang)
-                        break
+        if not found:
+            # Only now pay for the deep walk; a manifest hit at the root is the common case.
+            found = {
+                self.EXT_TO_LANG[ext]
+                for ext, count in self._scan().ext_counts.items()
+                if count > 3 and ext in self.EXT_TO_LANG
+            }
 
-        return detected
+        # Keep LANG_SIGNATURES order so primary_language is deterministic.
+        return [lang for lang in self.LANG_SIGNATURES if lang in found]
 
     def _detect_frameworks(self) -> list[str]:
+        scan = self._scan()
         detected = []
         for fw, markers in self.FRAMEWORK_SIGNATURES.items():
             for marker in markers:
-                if (self.project_dir / marker).exists():
+                if marker in scan.framework_hits:
                     detected.append(fw)
                     break
 
-        pkg_json = self.project_dir / "package.json"
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                all_deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-                fw_packages = {
-                    "react": "react",
-                    "vue": "vue",
-                    "angular": "@angular/core",
-                    "svelte": "svelte",
-                    "express": "express",
-                    "nextjs": "next",
-                    "nuxt": "nuxt",
-                }
-                for fw_name, pkg_name in fw_packages.items():
-                    if pkg_name in all_deps and fw_name not in detected:
-                        detected.append(fw_name)
-            except (json.JSONDecodeError, OSError):
-                pass
+        all_deps = self._package_deps()
+        for fw_name, pkg_name in self.FRAMEWORK_PACKAGES.items():
+            if pkg_name in all_deps and fw_name not in detected:
+                detected.append(fw_name)
 
         return detected
 
+    def _package_deps(self) -> dict:
+        """Merged dependencies + devDependencies from the root package.json (parsed once)."""
+        if self._pkg_deps is None:
+            self._pkg_deps = {}
+            if "package.json" in self._scan(deep=False).top_names:
+                try:
+                    data = _json_loads((self.project_dir / "package.json").read_bytes())
+                    self._pkg_deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+                except (json.JSONDecodeError, OSError, AttributeError):
+                    pass
+        return self._pkg_deps
+
     def _detect_structure(self) -> dict:
-        top_dirs = [d.name for d in self.project_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
-        top_files = [f.name for f in self.project_dir.iterdir() if f.is_file() and not f.name.startswith(".")]
-        return {"directories": sorted(top_dirs), "files": sorted(top_files)}
+        scan = self._scan(deep=False)
+        return {"directories": sorted(scan.top_dirs), "files": sorted(scan.top_files)}
 
     def _count_source_files(self, languages: list[str]) -> int:
-        extensions = set()
-        for lang in languages:
-            for ext in self.LANG_SIGNATURES.get(lang, {}).get("extensions", []):
-                extensions.add(ext)
+        extensions = frozenset(
+            ext for lang in languages for ext in self.LANG_SIGNATURES.get(lang, {}).get("extensions", [])
+        ) or self.DEFAULT_SOURCE_EXTENSIONS
+
+        ext_counts = self._scan().ext_counts
+        return sum(ext_counts.get(ext, 0) for ext in extensions)
+
+    def _marker_index(self) -> dict[str, frozenset[str]]:
+        """Group framework marker paths by parent directory so the walk can probe by basename."""
+        index: dict[str, set[str]] = {}
+        for markers in self.FRAMEWORK_SIGNATURES.values():
+            for marker in markers:
+                parent, _, name = marker.rpartition("/")
+                index.setdefault(parent, set()).add(name)
+        return {parent: frozenset(names) for parent, names in index.items()}
+
+    def _scan(self, deep: bool = True) -> ScanResult:
+        """Walk the project once with scandir and collect everything detect() needs (cached).
+
+        A shallow scan lists only the root (top-level entries and flags); a deep scan also
+        fills ext_counts and nested framework hits. A cached deep scan satisfies both.
+        """
+        cached = self._scan_result
+        if cached is not None and (cached.deep or not deep):
+            return cached
+
+        result = ScanResult(deep=deep)
+        marker_index = self._marker_index()
+        stack: list[tuple[str, str]] = [(str(self.project_dir), "")]
+        while stack:
+            path, rel_dir = stack.pop()
+            try:
+                it = os.scandir(path)
+            except OSError:
+                continue
+            is_root = not rel_dir
+            markers = marker_index.get(rel_dir)
+            with it:
+                for entry in it:
+                    name = entry.name
+                    if is_root:
+                        result.top_names.add(name)
+                    if markers and name in markers:
+                        result.framework_hits.add(f"{rel_dir}/{name}" if rel_dir else name)
+                    if name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if is_root:
+                                result.top_dirs.append(name)
+                            if deep and name not in self.SKIP_DIRS:
+                                stack.append((entry.path, f"{rel_dir}/{name}" if rel_dir else name))
+                        elif entry.is_file(follow_symlinks=False):
+                            if is_root:
+                                result.top_files.append(name)
+                            if deep:
+                                ext = os.path.splitext(name)[1]
+                                result.ext_counts[ext] = result.ext_counts.get(ext, 0) + 1
+                    except OSError:
+                        continue
+
+        top = result.top_names
+        result.has_git = ".git" in top
+        result.has_tests = any(d in top for d in self.TEST_DIRS)
+        result.has_ci = any(m in top for m in self.CI_MARKERS) or (
+            ".github" in top and (self.project_dir / ".github" / "workflows").exists()
+        )
 
-        if not extensions:
-            extensions = {".py", ".js", ".ts", ".go", ".rs", ".java"}
+        self._scan_result = result
+        return result
 
-        count = 0
-        for f in self.project_dir.rglob("*"):
-            if f.is_file() and f.suffix in extensions:
-                if not any(p.startswith(".") for p in f.parts) and "__pycache__" not in str(f):
-                    count += 1
-        return count
+
+@dataclass
+class ScanResult:
+    """Everything ProjectDetector learns from a single walk of the project tree."""
+
+    ext_counts: dict[str, int] = field(default_factory=dict)
+    top_names: set[str] = field(default_factory=set)
+    top_dirs: list[str] = field(default_factory=list)
+    top_files: list[str] = field(default_factory=list)
+    framework_hits: set[str] = field(default_factory=set)
+    has_git: bool = False
+    has_tests: bool = False
+    has_ci: bool = False
+    deep: bool = False
 
 
 class Bootstrap:
     """Auto-setup and configuration for SkyProject."""
 
-    def __init__(self, target_dir: Optional[str] = None):
+    DATA_SUBDIRS = frozenset({"tasks", "logs", "improvements", "vector_db"})
+
+    def __init__(
+        self,
+        target_dir: Optional[str] = None,
+        force_reinstall: bool = False,
+        wait_index: bool = False,
+    ):
         self.sky_root = Path(__file__).parent.parent.parent
         self.target_dir = Path(target_dir) if target_dir else self.sky_root
         self.data_dir = self.sky_root / "data"
         self.config_file = self.data_dir / "project_config.json"
+        self.deps_hash_file = self.data_dir / ".deps_hash"
+        self.force_reinstall = force_reinstall
+        self.wait_index = wait_index
+        self.index_thread: Optional[threading.Thread] = None
 
     def run(self) -> dict:
         """Full bootstrap sequence."""
@@ -174,19 +286,63 @@ class Bootstrap:
 
         self._ensure_directories()
         self._check_python_version()
-        self._install_dependencies()
-        self._setup_env()
 
-        project_profile = self._detect_project()
+        # pip is subprocess-bound and detection is filesystem-bound, so overlap them.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            deps_install = pool.submit(self._install_dependencies)
+            self._setup_env()
+            project_profile = self._detect_project()
+            deps_install.result()
+
         self._save_config(project_profile)
-        self._index_codebase(project_profile)
+
+        if self.wait_index:
+            self._index_codebase(project_profile)
+        else:
+            self._start_background_index(project_profile)
 
         console.print("\n[bold green]Bootstrap complete![/bold green]")
         return project_profile
 
+    def _start_background_index(self, profile: dict) -> None:
+        """Index in a daemon thread so run() returns as soon as the config is saved.
+
+        Callers that exit afterwards join it through wait_for_index(). A daemon never holds up
+        interpreter exit on Ctrl+C; an interrupted index leaves no ready marker, so the next
+        ensure_indexed() redoes it.
+        """
+        from skyproject.core.code_index import begin_background_index, end_background_index
+
+        def _run() -> None:
+            try:
+                self._index_codebase(profile)
+            finally:
+                end_background_index()
+
+        begin_background_index()
+        self.index_thread = threading.Thread(target=_run, name="skyproject-index", daemon=True)
+        self.index_thread.start()
+        console.print("[dim]Indexing codebase in the background...[/dim]")
+
+    def wait_for_index(self) -> None:
+        """Block until a background index started by run() has finished.
+
+        Short-lived callers such as `skyproject init` must call this before exiting: the index
+        thread is a daemon, so process exit would otherwise kill it midway through an upsert.
+        """
+        if self.index_thread is not None:
+            console.print("[dim]Waiting for the codebase index to finish...[/dim]")
+            self.index_thread.join()
+            self.index_thread = None
+
     def _ensure_directories(self) -> None:
         console.print("[dim]Creating data directories...[/dim]")
-        for d in ["tasks", "logs", "improvements", "vector_db"]:
+        try:
+            with os.scandir(self.data_dir) as it:
+                existing = {e.name for e in it if e.is_dir()}
+        except FileNotFoundError:
+            existing = set()
+        for d in self.DATA_SUBDIRS - existing:
             (self.data_dir / d).mkdir(parents=True, exist_ok=True)
 
     def _check_python_version(self) -> None:
@@ -202,18 +358,38 @@ class Bootstrap:
             logger.warning("requirements.txt not found, skipping dependency install")
             return
 
+        deps_hash = self._deps_hash(req_file)
+        if not self.force_reinstall and self._read_deps_hash() == deps_hash:
+            console.print("[green]Dependencies up to date[/green]")
+            return
+
         console.print("[dim]Installing dependencies...[/dim]")
         try:
             subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", str(req_file), "-q"],
+                [
+                    sys.executable, "-m", "pip", "install", "-r", str(req_file),
+                    "-q", "--disable-pip-version-check",
+                ],
                 check=True,
                 capture_output=True,
                 text=True,
             )
+            self.deps_hash_file.write_text(deps_hash)
             console.print("[green]Dependencies installed[/green]")
         except subprocess.CalledProcessError as e:
             console.print(f"[yellow]Dependency install warning: {e.stderr[:200]}[/yellow]")
 
+    @staticmethod
+    def _deps_hash(req_file: Path) -> str:
+        """Hash requirements.txt together with the interpreter path it was installed into."""
+        return hashlib.blake2b(req_file.read_bytes() + sys.executable.encode()).hexdigest()
+
+    def _read_deps_hash(self) -> Optional[str]:
+        try:
+            return self.deps_hash_file.read_text().strip()
+        except OSError:
+            return None
+
     def _setup_env(self) -> None:
         env_file = self.sky_root / ".env"
         if env_file.exists():
@@ -243,8 +419,14 @@ class Bootstrap:
 
     def _detect_project(self) -> dict:
         console.print(f"[dim]Detecting project at {self.target_dir}...[/dim]")
-        detector = ProjectDetector(self.target_dir)
-        profile = detector.detect()
+        signature = self._project_signature()
+        profile = self._load_cached_profile(signature)
+        if profile is None:
+            detector = ProjectDetector(self.target_dir)
+            profile = detector.detect()
+            profile["_signature"] = signature
+        else:
+            console.print("  [dim](unchanged since last init, using saved profile)[/dim]")
 
         console.print(f"  Language: [cyan]{profile['primary_language']}[/cyan]")
         console.print(f"  Frameworks: [cyan]{', '.join(profile['frameworks']) or 'none'}[/cyan]")
@@ -254,6 +436,31 @@ class Bootstrap:
 
         return profile
 
+    def _project_signature(self) -> list:
+        """Cheap change signature for the target project: root and manifest mtimes."""
+
+        def mtime(path: Path) -> Optional[int]:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return None
+
+        return [
+            str(self.target_dir),
+            mtime(self.target_dir),
+            mtime(self.target_dir / "requirements.txt"),
+            mtime(self.target_dir / "package.json"),
+        ]
+
+    def _load_cached_profile(self, signature: list) -> Optional[dict]:
+        try:
+            profile = _json_loads(self.config_file.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(profile, dict) or profile.get("_signature") != signature:
+            return None
+        return profile
+
     def _index_codebase(self, profile: dict) -> None:
         console.print("[dim]Indexing codebase into vector DB...[/dim]")
         try:
@@ -271,5 +478,5 @@ class Bootstrap:
 
     def _save_config(self, profile: dict) -> None:
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        self.config_file.write_text(json.dumps(profile, indent=2, default=str))
+        self.config_file.write_bytes(_json_dumps_pretty(profile))
         console.print("[green]Project config saved[/green]")
@@ -2,51 +2,153 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from skyproject.core.config import DATA_DIR
 from skyproject.shared.code_chunker import CodeChunker
 from skyproject.shared.vector_store import CodeVectorStore, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# Touched after a full index; its absence means the store may be partial.
+INDEX_READY_MARKER = DATA_DIR / ".index_ready"
+
+# Cleared while a background index (started by Bootstrap) is running in this process.
+_index_idle = threading.Event()
+_index_idle.set()
+
+
+def begin_background_index() -> None:
+    """Mark a background index as in flight; searches block until end_background_index()."""
+    _index_idle.clear()
+    INDEX_READY_MARKER.unlink(missing_ok=True)
+
+
+def end_background_index() -> None:
+    _index_idle.set()
+
 
 class CodeIndex:
     """Central code index used by both PM AI and IrgatAI to query the codebase efficiently."""
 
+    MODULES = ("pm_ai", "irgat_ai", "core", "shared")
+    CONTEXT_CACHE_SIZE = 128
+
     def __init__(self, project_root: Optional[Path] = None):
         self.store = CodeVectorStore()
         self.chunker = CodeChunker(project_root=project_root)
         self._indexed = False
+        self._generation = 0
+        self._ctx_cache: OrderedDict[tuple, str] = OrderedDict()
+
+    def _invalidate(self) -> None:
+        """Bump the index generation so cached contexts built before a write are never reused."""
+        self._generation += 1
+        self._ctx_cache.clear()
 
     def index_module(self, module_name: str) -> int:
         """Index a single module (pm_ai, irgat_ai, core, shared)."""
         chunks = self.chunker.chunk_module(module_name)
+        self._invalidate()
         return self.store.index_chunks(chunks)
 
-    def index_all(self) -> int:
-        """Index the entire SkyProject codebase."""
-        total = 0
-        for module in ("pm_ai", "irgat_ai", "core", "shared"):
-            total += self.index_module(module)
+    def index_all(self, max_batch: int = 256) -> int:
+        """Index the entire SkyProject codebase.
+
+        All chunks are submitted to the store together, which embeds them in ``max_batch``-sized
+        upserts.
+        """
+        total = self.store.index_chunks(self._chunk_modules(self.MODULES), max_batch=max_batch)
+        self._invalidate()
         self._indexed = True
+        INDEX_READY_MARKER.touch()
         logger.info("Full index complete: %d chunks total in store", self.store.count)
         return total
 
+    def _chunk_modules(self, modules: tuple[str, ...]) -> list:
+        # Serial on purpose: chunking is a few ms of ast parsing per module, far below the cost of
+        # spawning a process pool, and index_all() also runs on Bootstrap's background thread.
+        return [c for module in modules for c in self.chunker.chunk_module(module)]
+
     def index_directory(self, directory: str) -> int:
         """Index an arbitrary directory (for target project support)."""
         chunks = self.chunker.chunk_directory(directory)
+        self._invalidate()
         return self.store.index_chunks(chunks)
 
     def index_file(self, file_path: str, content: Optional[str] = None) -> int:
         """Re-index a single file after changes."""
         self.store.remove_file(file_path)
         chunks = self.chunker.chunk_file(file_path, content)
+        self._invalidate()
         return self.store.index_chunks(chunks)
 
+    def index_files(self, files: list[tuple[str, Optional[str]]], max_batch: int = 256) -> int:
+        """Re-index several changed files with one embedding batch instead of one per file."""
+        chunks = []
+        for file_path, content in files:
+            self.store.remove_file(file_path)
+            chunks.extend(self.chunker.chunk_file(file_path, content))
+        self._invalidate()
+        return self.store.index_chunks(chunks, max_batch=max_batch)
+
+    def reindex_changed_since(self, since: float, max_batch: int = 256) -> int:
+        """Re-index only the module files modified after ``since`` (a ``time.time()`` value).
+
+        Unchanged files are never re-chunked or re-embedded. Returns count of newly indexed chunks.
+        """
+        changed = [rel for rel, mtime in self._module_files() if mtime > since]
+        if not changed:
+            return 0
+        chunks = []
+        for rel in changed:
+            self.store.remove_file(rel)
+            chunks.extend(self.chunker.chunk_file(rel))
+        total = self.store.index_chunks(chunks, max_batch=max_batch)
+        self._invalidate()
+        if INDEX_READY_MARKER.exists():
+            # The store is still complete; advance the marker so a restart resumes from here
+            INDEX_READY_MARKER.touch()
+        logger.info("Incremental index: %d changed files -> %d chunks", len(changed), total)
+        return total
+
+    def last_indexed_at(self) -> float:
+        """When the store was last brought up to date (marker mtime), or 0.0 if never."""
+        try:
+            return INDEX_READY_MARKER.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _module_files(self) -> Iterator[tuple[str, float]]:
+        """Yield (relative path, mtime) for every Python file in MODULES, pruning hidden and cache dirs."""
+        root = self.chunker.project_root
+        stack = [str(root / "skyproject" / module) for module in self.MODULES]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.name.startswith(".") or entry.name == "__pycache__":
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        try:
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            continue
+                        yield os.path.relpath(entry.path, root), mtime
+
     def ensure_indexed(self) -> None:
-        """Index if not already done."""
-        if not self._indexed and self.store.count == 0:
+        """Index if not already done, waiting for any in-flight background index first."""
+        _index_idle.wait()
+        if not self._indexed and (self.store.count == 0 or not INDEX_READY_MARKER.exists()):
             self.index_all()
 
     def search(
@@ -65,22 +167,38 @@ class CodeIndex:
         """Build a compact LLM context string from the most relevant chunks.
 
         Estimates ~4 chars per token and stops adding chunks when the budget is reached.
+        Results are LRU-cached per index generation, so repeated descriptions across cycles
+        skip the vector query until the index changes.
         """
-        self.ensure_indexed()
-        results = self.search(task_description, n_results=15, module=module)
-
-        context_parts: list[str] = []
-        char_budget = max_tokens * 4
-        used = 0
+        return self.get_contexts_for_tasks([task_description], module=module, max_tokens=max_tokens)[0]
 
-        for r in results:
-            entry = f"--- {r.file_path} :: {r.name} (L{r.start_line}-{r.end_line}, relevance={r.relevance_score:.2f}) ---\n{r.content}\n"
-            if used + len(entry) > char_budget:
-                break
-            context_parts.append(entry)
-            used += len(entry)
-
-        return "\n".join(context_parts)
+    def get_contexts_for_tasks(
+        self, task_descriptions: list[str], module: Optional[str] = None, max_tokens: int = 3000
+    ) -> list[str]:
+        """Build one context string per description, sharing a single vector query for cache misses."""
+        self.ensure_indexed()
+        keys = [(d, module, max_tokens, self._generation, self.store.count) for d in task_descriptions]
+        contexts: list[Optional[str]] = []
+        for key in keys:
+            cached = self._ctx_cache.get(key)
+            if cached is not None:
+                self._ctx_cache.move_to_end(key)
+            contexts.append(cached)
+
+        missing = list(dict.fromkeys(key[0] for key, ctx in zip(keys, contexts) if ctx is None))
+        if missing:
+            if module:
+                batches = self.store.search_many(missing, n_results=15, module_filter=module)
+            else:
+                batches = self.store.search_many(missing, n_results=15)
+            built = {d: _format_context(results, max_tokens) for d, results in zip(missing, batches)}
+            for i, key in enumerate(keys):
+                if contexts[i] is None:
+                    contexts[i] = built[key[0]]
+                    self._ctx_cache[key] = contexts[i]
+            while len(self._ctx_cache) > self.CONTEXT_CACHE_SIZE:
+                self._ctx_cache.popitem(last=False)
+        return contexts
 
     def get_module_summary(self, module: str) -> str:
         """Get a structural summary of a module (classes/functions list)."""
@@ -90,3 +208,23 @@ class CodeIndex:
     def remove_file(self, file_path: str) -> None:
         """Remove a file from the index."""
         self.store.remove_file(file_path)
+        self._invalidate()
+
+
+def _format_context(results: list[SearchResult], max_tokens: int) -> str:
+    """Join search hits into a context string, stopping at ~4 chars per token of budget."""
+    context_parts: list[str] = []
+    char_budget = max_tokens * 4
+    used = 0
+
+    for r in results:
+        entry = (
+            f"--- {r.file_path} :: {r.name} (L{r.start_line}-{r.end_line}, "
+            f"relevance={r.relevance_score:.2f}) ---\n{r.content}\n"
+        )
+        if used + len(entry) > char_budget:
+            break
+        context_parts.append(entry)
+        used += len(entry)
+
+    return "\n".join(context_parts)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import inspect
+import itertools
 import logging
+import math
+import os
+import weakref
 from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Coroutine, Optional, Dict
 
-import aiofiles
-
 from skyproject.core.config import LOGS_DIR, Config
 from skyproject.shared.models import Message
 
@@ -17,26 +20,93 @@ from skyproject.shared.models import Message
 logger = logging.getLogger(__name__)
 
 MessageHandler = Callable[[Message], Coroutine[Any, Any, None]]
+SyncMessageHandler = Callable[[Message], None]
+BatchMessageHandler = Callable[[list[Message]], Coroutine[Any, Any, None]]
+
+# The message log is buffered and written in bulk once either threshold is hit,
+# or by the periodic flusher for low-rate traffic.
+LOG_FLUSH_LINES = 1000
+LOG_FLUSH_BYTES = 256 * 1024
+LOG_FLUSH_INTERVAL = 0.5
+
+ACK_TIMEOUT = 30.0
+
+# adjust_queue_sizes() never grows a queue past this multiple of Config.MAX_QUEUE_SIZE
+QUEUE_HARD_CAP_FACTOR = 10
+
+# Ids of recently delivered messages remembered for dropping retransmitted copies
+SEEN_IDS_WINDOW = 4096
+
+# Ack timeouts and retry backoffs share one hashed timing wheel: ACK_WHEEL_SLOTS
+# buckets, advanced every ACK_WHEEL_TICK seconds; longer delays wrap in rounds.
+ACK_WHEEL_SLOTS = 64
+ACK_WHEEL_TICK = 1.0
 
 
 class ResizableQueue(asyncio.Queue):
     """A custom asyncio queue that allows dynamic resizing safely."""
 
+    LOAD_WINDOW = 100
+
     def __init__(self, maxsize: int = 0):
         super().__init__(maxsize=maxsize)
-        self._historical_load = deque(maxlen=100)
+        # Fixed ring of the last LOAD_WINDOW samples plus their running sum
+        self._load_ring = [0] * self.LOAD_WINDOW
+        self._load_idx = 0
+        self._load_count = 0
+        self._load_sum = 0
+        # Set whenever a slot may have opened up; producers wait on it instead of polling
+        self._not_full = asyncio.Event()
+        self._set_watermarks()
+
+    def get_nowait(self):
+        """Remove and return an item, waking producers blocked on a full queue."""
+        item = super().get_nowait()  # asyncio.Queue.get() funnels through here as well
+        self._not_full.set()
+        return item
 
     def resize(self, new_maxsize: int) -> None:
         """Resize the queue safely."""
         self._maxsize = new_maxsize
+        self._set_watermarks()
+        self._not_full.set()
+
+    def _set_watermarks(self) -> None:
+        # Load thresholds only change with maxsize, so precompute them here
+        self._high_mark = int(self._maxsize * 0.8)
+        self._low_mark = int(self._maxsize * 0.2)
+
+    async def wait_not_full(self) -> None:
+        """Block until the queue has room for at least one more item."""
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
 
     def record_load(self, load: int) -> None:
         """Record the current load of the queue."""
-        self._historical_load.append(load)
+        idx = self._load_idx
+        self._load_sum += load - self._load_ring[idx]
+        self._load_ring[idx] = load
+        self._load_idx = (idx + 1) % self.LOAD_WINDOW
+        if self._load_count < self.LOAD_WINDOW:
+            self._load_count += 1
 
     def average_load(self) -> float:
         """Calculate the average load from historical data."""
-        return sum(self._historical_load) / len(self._historical_load) if self._historical_load else 0
+        return self._load_sum / self._load_count if self._load_count else 0
+
+
+class _BatchSubscription:
+    """Buffer for a batched subscriber; flushed by size or after a short delay."""
+
+    __slots__ = ("handler", "max_batch", "max_delay", "buffer", "timer")
+
+    def __init__(self, handler: BatchMessageHandler, max_batch: int, max_delay: float):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.buffer: list[Message] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
 
 
 class MessageBus:
@@ -48,12 +118,33 @@ class MessageBus:
             "irgat": ResizableQueue(maxsize=Config.MAX_QUEUE_SIZE),
         }
         self._handlers: Dict[str, list[MessageHandler]] = defaultdict(list)
-        self._history: list[Message] = []
+        # Plain-function subscribers are run inline instead of being scheduled
+        self._sync_handlers: Dict[str, list[SyncMessageHandler]] = defaultdict(list)
+        self._batch_subscriptions: Dict[str, list[_BatchSubscription]] = defaultdict(list)
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._history: deque[Message] = deque(maxlen=Config.MAX_HISTORY)
         self._log_file = LOGS_DIR / "messages.jsonl"
-        self._acknowledgments: dict[str, asyncio.Event] = {}
+        self._log_buffer: list[bytes] = []
+        self._log_buffer_bytes = 0
+        self._log_lock = asyncio.Lock()
+        self._log_fd: Optional[int] = None
+        # message id -> future resolved True on ack, False once retries are exhausted
+        self._acknowledgments: dict[str, asyncio.Future[bool]] = {}
+        # Buckets of (rounds, is_resend, message, attempt), served by one supervisor task
+        self._ack_wheel: list[deque[tuple[int, bool, Message, int]]] = [deque() for _ in range(ACK_WHEEL_SLOTS)]
+        self._ack_cursor = 0
+        self._ack_pending = 0
+        self._ack_wakeup = asyncio.Event()
+        # Retransmitted copies still queued per message id, and a bounded window of delivered ids
+        self._retransmits: dict[str, int] = {}
+        self._seen_ids: set[str] = set()
+        self._seen_order: deque[str] = deque()
         self._adjustment_task: Optional[asyncio.Task] = None
         self._monitor_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._ack_task: Optional[asyncio.Task] = None
         self._background_started = False
+        atexit.register(_flush_log_at_exit, weakref.ref(self))
 
     def _ensure_background_tasks(self) -> None:
         """Start background tasks lazily when an event loop is available."""
@@ -66,37 +157,163 @@ class MessageBus:
         self._background_started = True
         self._adjustment_task = loop.create_task(self.adjust_queue_sizes())
         self._monitor_task = loop.create_task(self.monitor_message_flow())
+        self._flush_task = loop.create_task(self._flush_loop())
+        self._ack_task = loop.create_task(self._ack_supervisor())
 
     async def send(self, message: Message) -> None:
         """Send a message to the target's queue."""
+        await self._send(message, attempt=0)
+
+    async def send_many(self, messages: list[Message]) -> None:
+        """Send a batch of messages in order.
+
+        The batch is recorded and logged as a unit: its lines join the log buffer
+        together and go out in one locked write before the messages are enqueued.
+        """
+        if not messages:
+            return
+        self._ensure_background_tasks()
+        self._history.extend(messages)
+        for message in messages:
+            self._buffer_log_line(message)
+        await self.flush_log()
+        for message in messages:
+            await self._deliver(message)
+
+    async def send_reliable(self, message: Message) -> bool:
+        """Send a message and wait until it is acknowledged (True) or retries run out (False)."""
+        await self.send(message)
+        fut = self._acknowledgments.get(message.id)
+        if fut is None:
+            # Either acked before we looked, or there was no queue to deliver to.
+            return message.receiver in self._queues
+        return await asyncio.shield(fut)
+
+    async def _send(self, message: Message, attempt: int) -> None:
         self._ensure_background_tasks()
+        if attempt > 0:
+            # Retransmission: already recorded, logged and fanned out on the first attempt
+            target_queue = self._queues.get(message.receiver)
+            if target_queue:
+                await self._handle_backpressure(target_queue, message)
+                self._retransmits[message.id] = self._retransmits.get(message.id, 0) + 1
+                self._track_acknowledgment(message, attempt)
+            return
+
         self._history.append(message)
         await self._log_message(message)
+        await self._deliver(message)
 
+    async def _deliver(self, message: Message) -> None:
+        """Enqueue a recorded message for its receiver and fan it out to subscribers."""
         target_queue = self._queues.get(message.receiver)
         if target_queue:
             await self._handle_backpressure(target_queue, message)
-            self._acknowledgments[message.id] = asyncio.Event()
-            asyncio.create_task(self._wait_for_acknowledgment(message))
+            self._track_acknowledgment(message, 0)
 
-        for handler in self._handlers.get(message.msg_type, []):
-            asyncio.create_task(handler(message))
+        for handler in self._sync_handlers.get(message.msg_type, ()):
+            try:
+                result = handler(message)
+                if inspect.isawaitable(result):  # e.g. a lambda wrapping a coroutine function
+                    asyncio.ensure_future(result)
+            except Exception:
+                logger.exception("Handler %r failed for message %s", handler, message.id)
+        handlers = self._handlers.get(message.msg_type)
+        if handlers:
+            asyncio.create_task(self._run_handlers(list(handlers), message))
+        for sub in self._batch_subscriptions.get(message.msg_type, ()):
+            self._buffer_for_batch(sub, message)
+
+    async def _run_handlers(self, handlers: list[MessageHandler], message: Message) -> None:
+        """Run every async subscriber for a message under one task."""
+        results = await asyncio.gather(*(h(message) for h in handlers), return_exceptions=True)
+        for handler, result in zip(handlers, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Handler %r failed for message %s", handler, message.id,
+                    exc_info=(type(result), result, result.__traceback__),
+                )
 
     async def receive(self, receiver: str, timeout: float = 30.0) -> Optional[Message]:
         """Wait for a message from the queue."""
         queue = self._queues.get(receiver)
         if not queue:
             return None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         try:
-            message = await asyncio.wait_for(queue.get(), timeout=timeout)
-            await self.acknowledge(message.id)
-            return message
+            while True:
+                message = await asyncio.wait_for(queue.get(), timeout=max(0.0, deadline - loop.time()))
+                if not self._is_duplicate_delivery(message):
+                    await self.acknowledge(message.id)
+                    return message
         except asyncio.TimeoutError:
             return None
 
-    def subscribe(self, msg_type: str, handler: MessageHandler) -> None:
+    def _is_duplicate_delivery(self, message: Message) -> bool:
+        """True for a retransmitted copy of a message that was already delivered."""
+        msg_id = message.id
+        pending = self._retransmits.get(msg_id)
+        if pending and msg_id in self._seen_ids:
+            if pending == 1:
+                del self._retransmits[msg_id]
+            else:
+                self._retransmits[msg_id] = pending - 1
+            return True
+        if msg_id not in self._seen_ids:
+            self._seen_ids.add(msg_id)
+            self._seen_order.append(msg_id)
+            if len(self._seen_order) > SEEN_IDS_WINDOW:
+                self._seen_ids.discard(self._seen_order.popleft())
+        return False
+
+    def subscribe_batched(
+        self,
+        msg_type: str,
+        handler: BatchMessageHandler,
+        max_batch: int = 128,
+        max_delay_ms: float = 50,
+    ) -> None:
+        """Subscribe with a handler that receives lists of messages.
+
+        A batch is delivered once ``max_batch`` messages are buffered, or
+        ``max_delay_ms`` after the first message of the batch arrived.
+        """
+        self._batch_subscriptions[msg_type].append(
+            _BatchSubscription(handler, max(1, max_batch), max_delay_ms / 1000)
+        )
+
+    def _buffer_for_batch(self, sub: _BatchSubscription, message: Message) -> None:
+        sub.buffer.append(message)
+        if len(sub.buffer) >= sub.max_batch:
+            self._flush_batch(sub)
+        elif sub.timer is None:
+            sub.timer = asyncio.get_running_loop().call_later(sub.max_delay, self._flush_batch, sub)
+
+    def _flush_batch(self, sub: _BatchSubscription) -> None:
+        if sub.timer is not None:
+            sub.timer.cancel()
+            sub.timer = None
+        if not sub.buffer:
+            return
+        # Hand the whole buffer over and start a fresh one; no copying
+        batch, sub.buffer = sub.buffer, []
+        task = asyncio.get_running_loop().create_task(self._run_batch_handler(sub.handler, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch_handler(self, handler: BatchMessageHandler, batch: list[Message]) -> None:
+        try:
+            await handler(batch)
+        except Exception:
+            logger.exception("Batched handler %r failed for %d messages", handler, len(batch))
+
+    def subscribe(self, msg_type: str, handler: MessageHandler | SyncMessageHandler) -> None:
         """Subscribe to a specific message type."""
-        self._handlers[msg_type].append(handler)
+        if inspect.iscoroutinefunction(handler):
+            self._handlers[msg_type].append(handler)
+        else:
+            self._sync_handlers[msg_type].append(handler)
 
     async def receive_all(self, receiver: str) -> list[Message]:
         """Drain all pending messages for a receiver."""
@@ -107,6 +324,8 @@ class MessageBus:
         while not queue.empty():
             try:
                 message = queue.get_nowait()
+                if self._is_duplicate_delivery(message):
+                    continue
                 await self.acknowledge(message.id)
                 messages.append(message)
             except asyncio.QueueEmpty:
@@ -114,42 +333,152 @@ class MessageBus:
         return messages
 
     def get_history(self, limit: int = 50) -> list[Message]:
-        return self._history[-limit:]
+        # Walk from the right end so the cost is O(limit), not O(len(history))
+        recent = list(itertools.islice(reversed(self._history), max(0, limit)))
+        recent.reverse()
+        return recent
 
     async def acknowledge(self, message_id: str) -> None:
         """Acknowledge receipt of a message."""
-        if message_id in self._acknowledgments:
-            self._acknowledgments[message_id].set()
+        fut = self._acknowledgments.pop(message_id, None)
+        if fut is not None and not fut.done():
+            fut.set_result(True)
+            logger.info("Message %s acknowledged successfully.", message_id)
+
+    def _track_acknowledgment(self, message: Message, attempt: int) -> None:
+        fut = self._acknowledgments.get(message.id)
+        if fut is None or fut.done():
+            self._acknowledgments[message.id] = asyncio.get_running_loop().create_future()
+        self._schedule_ack_timer(ACK_TIMEOUT, False, message, attempt)
+
+    def _schedule_ack_timer(self, delay: float, is_resend: bool, message: Message, attempt: int) -> None:
+        ticks = max(1, math.ceil(delay / ACK_WHEEL_TICK))
+        rounds, offset = divmod(ticks - 1, ACK_WHEEL_SLOTS)
+        slot = (self._ack_cursor + offset + 1) % ACK_WHEEL_SLOTS
+        self._ack_wheel[slot].append((rounds, is_resend, message, attempt))
+        self._ack_pending += 1
+        self._ack_wakeup.set()
+
+    async def _ack_supervisor(self) -> None:
+        """Single long-lived task that turns the ack timer wheel; parks while it is empty."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        try:
+            while True:
+                if not self._ack_pending:
+                    self._ack_wakeup.clear()
+                    await self._ack_wakeup.wait()
+                    next_tick = loop.time()
+                next_tick += ACK_WHEEL_TICK
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+                self._advance_ack_wheel()
+        except asyncio.CancelledError:
+            pass
+
+    def _advance_ack_wheel(self) -> None:
+        self._ack_cursor = (self._ack_cursor + 1) % ACK_WHEEL_SLOTS
+        bucket = self._ack_wheel[self._ack_cursor]
+        # Entries added to this bucket while firing wait for the next lap
+        for _ in range(len(bucket)):
+            rounds, is_resend, message, attempt = bucket.popleft()
+            if rounds:
+                bucket.append((rounds - 1, is_resend, message, attempt))
+                continue
+            self._ack_pending -= 1
+            self._on_ack_timer(is_resend, message, attempt)
+
+    def _on_ack_timer(self, is_resend: bool, message: Message, attempt: int) -> None:
+        fut = self._acknowledgments.get(message.id)
+        if fut is None or fut.done():
+            return
+        if is_resend:
+            asyncio.create_task(self._send(message, attempt))
+            return
 
-    async def _wait_for_acknowledgment(self, message: Message, timeout: float = 30.0) -> None:
-        """Wait for acknowledgment of a message with a retry mechanism."""
         max_retries = Config.MAX_RETRIES
-        for attempt in range(max_retries):
-            try:
-                await asyncio.wait_for(self._acknowledgments[message.id].wait(), timeout=timeout)
-                logger.info("Message %s acknowledged successfully.", message.id)
-                del self._acknowledgments[message.id]  # Cleanup ack event
-                return
-            except asyncio.TimeoutError:
-                logger.warning("Message %s not acknowledged, retrying %d/%d...", message.id, attempt + 1, max_retries)
-                if attempt < max_retries - 1:  # Avoid extra send on last attempt
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                    await self.send(message)  # Retry sending the message
+        logger.warning("Message %s not acknowledged, retrying %d/%d...", message.id, attempt + 1, max_retries)
+        if attempt < max_retries - 1:  # Avoid extra send on last attempt
+            self._schedule_ack_timer(2 ** attempt, True, message, attempt + 1)  # Exponential backoff
+            return
         logger.error("Message %s failed to be acknowledged after %d retries.", message.id, max_retries)
+        del self._acknowledgments[message.id]
+        fut.set_result(False)
 
     async def _handle_backpressure(self, queue: ResizableQueue[Message], message: Message) -> None:
         """Handle backpressure by waiting for space in the queue."""
-        while queue.full():
+        if queue.full():
             logger.warning("Queue for %s is full, waiting for space...", message.receiver)
-            await asyncio.sleep(1)
-        await queue.put(message)
+            await queue.wait_not_full()
+        queue.put_nowait(message)
 
     async def _log_message(self, message: Message) -> None:
+        """Buffer a message for the JSONL log; flush once the batch thresholds are reached."""
+        self._buffer_log_line(message)
+        if len(self._log_buffer) >= LOG_FLUSH_LINES or self._log_buffer_bytes >= LOG_FLUSH_BYTES:
+            await self.flush_log()
+
+    def _buffer_log_line(self, message: Message) -> None:
         try:
-            async with aiofiles.open(self._log_file, "a") as f:
-                await f.write(json.dumps(message.model_dump(mode="python"), default=str) + "\n")
-        except (OSError, json.JSONDecodeError) as e:
+            line = message.to_wire()
+        except TypeError as e:
             logger.error("Failed to log message %s: %s", message.id, e)
+            return
+        self._log_buffer.append(line)
+        self._log_buffer_bytes += len(line)
+
+    async def flush_log(self) -> None:
+        """Write all buffered log lines with a single write on the long-lived descriptor."""
+        if not self._log_buffer:
+            return
+        buffer, self._log_buffer = self._log_buffer, []
+        self._log_buffer_bytes = 0
+        data = b"".join(buffer)
+        async with self._log_lock:
+            try:
+                if self._log_fd is None:
+                    self._log_fd = os.open(self._log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                # One executor hop per batch; O_APPEND writes need no seek or userspace flush
+                await asyncio.get_running_loop().run_in_executor(None, _write_all, self._log_fd, data)
+            except OSError as e:
+                logger.error("Failed to write %d messages to log: %s", len(buffer), e)
+
+    async def _flush_loop(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(LOG_FLUSH_INTERVAL)
+                await self.flush_log()
+        except asyncio.CancelledError:
+            pass
+
+    async def close(self) -> None:
+        """Stop background tasks, flush the message log and close its handle."""
+        for task in (self._adjustment_task, self._monitor_task, self._flush_task, self._ack_task):
+            if task:
+                task.cancel()
+        for subs in self._batch_subscriptions.values():
+            for sub in subs:
+                self._flush_batch(sub)
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        await self.flush_log()
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def _flush_log_sync(self) -> None:
+        """Last-chance flush at interpreter exit, when no event loop is available."""
+        if not self._log_buffer:
+            return
+        buffer, self._log_buffer = self._log_buffer, []
+        self._log_buffer_bytes = 0
+        try:
+            if self._log_fd is not None:
+                _write_all(self._log_fd, b"".join(buffer))
+            else:
+                with open(self._log_file, "ab") as f:
+                    f.write(b"".join(buffer))
+        except OSError as e:
+            logger.error("Failed to write %d messages to log: %s", len(buffer), e)
 
     async def monitor_message_flow(self) -> None:
         """Monitor message flow and log statistics."""
@@ -159,8 +488,7 @@ class MessageBus:
             logger.info("Currently %d messages pending acknowledgment.", pending_ack_count)
 
             for receiver, queue in self._queues.items():
-                delay_threshold = Config.MAX_QUEUE_SIZE * 0.8
-                if queue.qsize() > delay_threshold:
+                if queue.qsize() > queue._high_mark:
                     logger.warning("Potential bottleneck detected for %s: %d messages in queue.", receiver, queue.qsize())
 
     def _start_adjustment_task(self) -> None:
@@ -176,13 +504,27 @@ class MessageBus:
                     queue.record_load(queue.qsize())
                     average_load = queue.average_load()
 
-                    if average_load > queue.maxsize * 0.8:
-                        new_size = min(queue.maxsize * 2, Config.MAX_QUEUE_SIZE * 10)
+                    if average_load > queue._high_mark:
+                        new_size = min(queue.maxsize * 2, Config.MAX_QUEUE_SIZE * QUEUE_HARD_CAP_FACTOR)
                         logger.info("Increasing queue size for %s to %d.", receiver, new_size)
                         queue.resize(new_size)
-                    elif average_load < queue.maxsize * 0.2 and queue.maxsize > Config.MAX_QUEUE_SIZE:
+                    elif average_load < queue._low_mark and queue.maxsize > Config.MAX_QUEUE_SIZE:
                         new_size = max(queue.maxsize // 2, Config.MAX_QUEUE_SIZE)
                         logger.info("Decreasing queue size for %s to %d.", receiver, new_size)
                         queue.resize(new_size)
         except asyncio.CancelledError:
-            logger.info("Queue size adjustment task was cancelled.")
\ No newline at end of file
+            logger.info("Queue size adjustment task was cancelled.")
+
+
+def _flush_log_at_exit(bus_ref: weakref.ref) -> None:
+    bus = bus_ref()
+    if bus is not None:
+        bus._flush_log_sync()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write until every byte is written (a single write may be partial)."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -18,7 +19,11 @@ for d in [TASKS_DIR, LOGS_DIR, IMPROVEMENTS_DIR, VECTOR_DB_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 
-class Config:
+# Read once at import. Config is a slotted singleton instance rather than a bare class, so
+# the per-tick reads in the message bus loops are slot loads instead of class-dict lookups.
+# Not frozen: the CLI and web settings page update a few fields at runtime.
+@dataclass(slots=True)
+class _Config:
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o")
     LOG_LEVEL: str = os.getenv("SKY_LOG_LEVEL", "INFO")
@@ -29,6 +34,7 @@ class Config:
     SELF_IMPROVE_EVERY_N_CYCLES: int = 5
     MAX_RETRIES: int = 3
     MAX_QUEUE_SIZE: int = int(os.getenv("SKY_MAX_QUEUE_SIZE", "100"))
+    MAX_HISTORY: int = int(os.getenv("SKY_MAX_HISTORY", "10000"))
 
     # Vector DB settings
     VECTOR_SEARCH_MAX_RESULTS: int = int(os.getenv("SKY_VECTOR_MAX_RESULTS", "10"))
@@ -70,3 +76,6 @@ You write clean, efficient, well-structured Python code.
 You follow best practices and design patterns.
 You aim for Cursor-level quality in everything you produce.
 When you improve yourself, you make targeted, safe changes."""
+
+
+Config = _Config()
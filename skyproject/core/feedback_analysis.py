@@ -1,16 +1,33 @@
 from __future__ import annotations
 
 import logging
-from collections import Counter
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from skyproject.shared.models import Task, TaskStatus
 from textblob import TextBlob
 import numpy as np
-from scipy.stats import linregress
 
 logger = logging.getLogger(__name__)
 
+# Dense int8 code per status so counts come from a single np.bincount
+STATUS_CODES: Dict[TaskStatus, int] = {status: code for code, status in enumerate(TaskStatus)}
+
+
+def encode_statuses(tasks: List[Task]) -> np.ndarray:
+    """Encode task statuses as an int8 array of STATUS_CODES."""
+    codes = STATUS_CODES
+    return np.fromiter((codes[task.status] for task in tasks), dtype=np.int8, count=len(tasks))
+
+
+@dataclass
+class FeedbackReport:
+    """Everything FeedbackAnalysis computes, gathered in one pass over the tasks."""
+    feedback: Dict[str, Any]
+    failures: Dict[str, Any]
+    trends: List[str]
+    sentiment: Optional[Dict[str, float]] = None
+
 
 class FeedbackAnalysis:
     """
@@ -18,21 +35,31 @@ class FeedbackAnalysis:
     """
 
     @staticmethod
-    def analyze_feedback(tasks: List[Task]) -> Dict[str, Any]:
+    def analyze_feedback(tasks: List[Task], status_array: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Analyze tasks to identify feedback patterns.
         :param tasks: List of Task objects
+        :param status_array: Optional pre-encoded statuses from encode_statuses()
         :return: Dictionary with analysis results
         """
-        status_counter = Counter(task.status for task in tasks)
+        if status_array is None:
+            status_array = encode_statuses(tasks)
+        hist = np.bincount(status_array, minlength=len(STATUS_CODES))
+        return FeedbackAnalysis._feedback_results(hist.tolist(), len(status_array))
+
+    @staticmethod
+    def _feedback_results(hist: List[int], total: int) -> Dict[str, Any]:
+        completed = int(hist[STATUS_CODES[TaskStatus.COMPLETED]])
+        failed = int(hist[STATUS_CODES[TaskStatus.FAILED]])
+        cancelled = int(hist[STATUS_CODES[TaskStatus.CANCELLED]])
 
         analysis_results = {
-            'total_tasks': len(tasks),
-            'completed_tasks': status_counter[TaskStatus.COMPLETED],
-            'failed_tasks': status_counter[TaskStatus.FAILED],
-            'cancelled_tasks': status_counter[TaskStatus.CANCELLED],
-            'success_rate': status_counter[TaskStatus.COMPLETED] / len(tasks) if tasks else 0,
-            'failure_rate': (status_counter[TaskStatus.FAILED] + status_counter[TaskStatus.CANCELLED]) / len(tasks) if tasks else 0
+            'total_tasks': total,
+            'completed_tasks': completed,
+            'failed_tasks': failed,
+            'cancelled_tasks': cancelled,
+            'success_rate': completed / total if total else 0,
+            'failure_rate': (failed + cancelled) / total if total else 0
         }
 
         logger.info("Feedback Analysis: %s", analysis_results)
@@ -72,12 +99,24 @@ class FeedbackAnalysis:
         :param tasks: List of Task objects
         :return: Dictionary with detailed analysis of failures
         """
-        failure_reasons = [task.failure_reason for task in tasks if task.status == TaskStatus.FAILED]
-        failure_counter = Counter(failure_reasons)
+        # Intern each reason to an int id (first-seen order), then count in one pass
+        reason_ids: Dict[Any, int] = {}
+        ids = [
+            reason_ids.setdefault(task.failure_reason, len(reason_ids))
+            for task in tasks if task.status == TaskStatus.FAILED
+        ]
+        reasons = list(reason_ids)
+        hist = np.bincount(np.asarray(ids, dtype=np.intp), minlength=len(reasons))
+        return FeedbackAnalysis._failure_results(reasons, hist)
+
+    @staticmethod
+    def _failure_results(reasons: List[Any], hist: np.ndarray) -> Dict[str, Any]:
+        # Stable sort keeps first-seen order among ties, like Counter.most_common()
+        order = np.argsort(-hist, kind="stable")
 
         detailed_analysis = {
-            'failure_reasons': failure_counter.most_common(),
-            'unique_failure_reasons': list(failure_counter)
+            'failure_reasons': [(reasons[i], int(hist[i])) for i in order],
+            'unique_failure_reasons': reasons
         }
 
         logger.info("Detailed Failure Analysis: %s", detailed_analysis)
@@ -108,16 +147,28 @@ class FeedbackAnalysis:
         :param tasks: List of Task objects
         :return: Dictionary with average polarity and subjectivity
         """
-        polarities = []
-        subjectivities = []
+        polarity_sum = 0.0
+        subjectivity_sum = 0.0
+        n = 0
 
         for task in tasks:
-            blob = TextBlob(task.description)
-            polarities.append(blob.sentiment.polarity)
-            subjectivities.append(blob.sentiment.subjectivity)
+            polarity, subjectivity = FeedbackAnalysis._score_sentiment(task.description)
+            polarity_sum += polarity
+            subjectivity_sum += subjectivity
+            n += 1
 
-        average_polarity = sum(polarities) / len(polarities) if polarities else 0.0
-        average_subjectivity = sum(subjectivities) / len(subjectivities) if subjectivities else 0.0
+        return FeedbackAnalysis._sentiment_results(polarity_sum, subjectivity_sum, n)
+
+    @staticmethod
+    def _score_sentiment(description: str) -> Tuple[float, float]:
+        # One TextBlob per description yields both scores from a single sentiment pass
+        sentiment = TextBlob(description).sentiment
+        return sentiment.polarity, sentiment.subjectivity
+
+    @staticmethod
+    def _sentiment_results(polarity_sum: float, subjectivity_sum: float, n: int) -> Dict[str, float]:
+        average_polarity = polarity_sum / n if n else 0.0
+        average_subjectivity = subjectivity_sum / n if n else 0.0
 
         sentiment_analysis_results = {
             'average_polarity': average_polarity,
@@ -158,22 +209,71 @@ class FeedbackAnalysis:
         :param tasks: List of Task objects
         :return: List of trend insights
         """
-        insights = []
         try:
             if len(tasks) < 2:
-                return insights
+                return []
 
             # Assume tasks are sorted by time
-            success_rates = [1 if task.status == TaskStatus.COMPLETED else 0 for task in tasks]
-            x = np.arange(len(success_rates))
-            slope, _, _, _, _ = linregress(x, success_rates)
-
-            if slope > 0:
-                insights.append("Success rate is trending upwards.")
-            elif slope < 0:
-                insights.append("Success rate is trending downwards.")
-            else:
-                insights.append("Success rate is stable.")
+            success = (encode_statuses(tasks) == STATUS_CODES[TaskStatus.COMPLETED]).astype(np.int64)
+            n = len(success)
+            sxy = int(np.dot(np.arange(n, dtype=np.int64), success))
+            return FeedbackAnalysis._trend_insights(n, int(success.sum()), sxy)
         except Exception as e:
             logger.error("Error detecting trends: %s", e)
-        return insights
+            return []
+
+    @staticmethod
+    def _trend_insights(n: int, sum_y: int, sum_xy: int) -> List[str]:
+        if n < 2:
+            return []
+        # Only the sign of the regression slope is needed: with x = 0..n-1 it is
+        # sign(n*sum(x*y) - sum(x)*sum(y)) = sign(2*sum(x*y) - (n-1)*sum(y))
+        slope_sign = 2 * sum_xy - (n - 1) * sum_y
+        if slope_sign > 0:
+            return ["Success rate is trending upwards."]
+        if slope_sign < 0:
+            return ["Success rate is trending downwards."]
+        return ["Success rate is stable."]
+
+    @staticmethod
+    def analyze_all(tasks: List[Task], include_sentiment: bool = True) -> FeedbackReport:
+        """
+        Run the status, failure, trend and (optionally) sentiment analyses in a single pass.
+        :param tasks: List of Task objects, assumed sorted by time
+        :param include_sentiment: Score task descriptions as well
+        :return: FeedbackReport with the same results as the individual methods
+        """
+        codes = STATUS_CODES
+        completed_code = codes[TaskStatus.COMPLETED]
+        failed_code = codes[TaskStatus.FAILED]
+        status_hist = [0] * len(codes)
+        reason_ids: Dict[Any, int] = {}
+        reason_counts: List[int] = []
+        sum_y = sum_xy = 0
+        polarity_sum = subjectivity_sum = 0.0
+
+        for i, task in enumerate(tasks):
+            code = codes[task.status]
+            status_hist[code] += 1
+            if code == completed_code:
+                sum_y += 1
+                sum_xy += i
+            elif code == failed_code:
+                reason_id = reason_ids.setdefault(task.failure_reason, len(reason_ids))
+                if reason_id == len(reason_counts):
+                    reason_counts.append(0)
+                reason_counts[reason_id] += 1
+            if include_sentiment:
+                polarity, subjectivity = FeedbackAnalysis._score_sentiment(task.description)
+                polarity_sum += polarity
+                subjectivity_sum += subjectivity
+
+        n = len(tasks)
+        return FeedbackReport(
+            feedback=FeedbackAnalysis._feedback_results(status_hist, n),
+            failures=FeedbackAnalysis._failure_results(list(reason_ids), np.asarray(reason_counts, dtype=np.int64)),
+            trends=FeedbackAnalysis._trend_insights(n, sum_y, sum_xy),
+            sentiment=(
+                FeedbackAnalysis._sentiment_results(polarity_sum, subjectivity_sum, n) if include_sentiment else None
+            ),
+        )
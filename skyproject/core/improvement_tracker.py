@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from typing import List, Dict
 
 from skyproject.core.task_store import TaskStore
@@ -28,8 +29,10 @@ class ImprovementTracker:
             logger.info("No tasks available for analysis.")
             return {"success_rate": 0.0, "failure_rate": 0.0}
 
-        success_count = sum(1 for task in tasks if task.status == TaskStatus.COMPLETED)
-        failure_count = sum(1 for task in tasks if task.status in [TaskStatus.FAILED, TaskStatus.CANCELLED])
+        # One pass over the tasks; everything else is a lookup in the status histogram
+        status_counts = Counter(task.status for task in tasks)
+        success_count = status_counts[TaskStatus.COMPLETED]
+        failure_count = status_counts[TaskStatus.FAILED] + status_counts[TaskStatus.CANCELLED]
 
         total = len(tasks)
         success_rate = success_count / total if total > 0 else 0.0
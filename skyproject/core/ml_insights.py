@@ -2,12 +2,10 @@ from __future__ import annotations
 
 import logging
 from collections import Counter
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.decomposition import PCA
 from sklearn.ensemble import IsolationForest
-from sklearn.linear_model import LinearRegression
-from typing import List
+from typing import List, Union
 import numpy as np
 
 from skyproject.shared.models import Task
@@ -21,27 +19,29 @@ class MLInsights:
     """
 
     @staticmethod
-    def analyze_patterns(tasks: List[Task]) -> List[str]:
+    def analyze_patterns(tasks: Union[List[Task], np.ndarray]) -> List[str]:
         """
         Analyze task performance patterns using machine learning techniques.
-        :param tasks: List of Task objects
+        :param tasks: List of Task objects, or a feature matrix from _prepare_data
         :return: List of insights as strings
         """
         try:
-            data = MLInsights._prepare_data(tasks)
-            if not data:
+            data = tasks if isinstance(tasks, np.ndarray) else MLInsights._prepare_data(tasks)
+            if not len(data):
                 logger.warning("No data available for analysis.")
                 return []
 
-            scaler = StandardScaler()
-            scaled_data = scaler.fit_transform(data)
+            # float32 end to end: PCA, KMeans and IsolationForest all accept it, at half the memory traffic
+            scaled_data = MLInsights._standardize(np.ascontiguousarray(data, dtype=np.float32))
 
+            # Fresh estimators per call: fitted state must not be shared between concurrent callers
             # Apply PCA for dimensionality reduction
             pca = PCA(n_components=2)  # Reduce to two dimensions for visualization
             reduced_data = pca.fit_transform(scaled_data)
 
             # Using 3 clusters as a default for simplicity and initial pattern discovery.
-            kmeans = KMeans(n_clusters=3, random_state=42)
+            # Mini-batches keep each update pass over a cache-sized tile of rows
+            kmeans = MiniBatchKMeans(n_clusters=3, batch_size=1024, random_state=42)
             kmeans.fit(reduced_data)
             labels = kmeans.labels_
 
@@ -61,24 +61,36 @@ class MLInsights:
             return []
 
     @staticmethod
-    def _prepare_data(tasks: List[Task]) -> List[List[float]]:
+    def _standardize(data: np.ndarray) -> np.ndarray:
+        """
+        Zero-mean, unit-variance scaling, matching StandardScaler (constant columns are left unscaled).
+        :param data: Feature matrix
+        :return: Scaled feature matrix
+        """
+        std = data.std(axis=0)
+        std[std == 0.0] = 1.0
+        return (data - data.mean(axis=0)) / std
+
+    @staticmethod
+    def _prepare_data(tasks: List[Task]) -> np.ndarray:
         """
         Prepare the task data for machine learning analysis.
         :param tasks: List of Task objects
-        :return: List of feature lists
+        :return: (N, 3) float32 matrix of duration, complexity and resources
         """
         try:
-            return [
-                [
-                    task.duration.total_seconds(),
-                    task.complexity_level,
-                    task.resources_used
-                ]
-                for task in tasks if task.duration is not None
-            ]
+            flat = np.fromiter(
+                (
+                    value
+                    for task in tasks if task.duration is not None
+                    for value in (task.duration.total_seconds(), task.complexity_level, task.resources_used)
+                ),
+                dtype=np.float32,
+            )
+            return flat.reshape(-1, 3)
         except AttributeError as e:
             logger.error("Data preparation error: %s", e)
-            return []
+            return np.empty((0, 3), dtype=np.float32)
 
     @staticmethod
     def _generate_insights(labels: List[int], variance_ratios: List[float]) -> List[str]:
@@ -101,10 +113,10 @@ class MLInsights:
         return insights
 
     @staticmethod
-    def _detect_anomalies(data: List[List[float]]) -> List[str]:
+    def _detect_anomalies(data: np.ndarray) -> List[str]:
         """
         Detect anomalies in task data using Isolation Forest.
-        :param data: List of feature lists
+        :param data: Feature matrix
         :return: List of anomaly insights
         """
         insights = []
@@ -120,22 +132,23 @@ class MLInsights:
         return insights
 
     @staticmethod
-    def _analyze_trends(data: List[List[float]]) -> List[str]:
+    def _analyze_trends(data: np.ndarray) -> List[str]:
         """
-        Analyze trends in task data using linear regression.
-        :param data: List of feature lists
+        Analyze trends in task data using a linear least-squares fit.
+        :param data: Feature matrix
         :return: List of trend insights
         """
         insights = []
         try:
             if len(data) >= 2:  # Need at least two points for trend analysis
-                x = np.arange(len(data)).reshape(-1, 1)  # Use index as the independent variable
-                y = np.array(data)
-
-                for i, feature in enumerate(['Duration', 'Complexity', 'Resources']):
-                    model = LinearRegression()
-                    model.fit(x, y[:, i])
-                    slope = model.coef_[0]
+                # Closed-form least-squares slopes for all three features in one matrix-vector
+                # product; centering y first (as LinearRegression does) keeps flat columns at 0
+                y = np.asarray(data, dtype=np.float64)
+                x = np.arange(len(y), dtype=np.float64)
+                x -= x.mean()
+                slopes = (x @ (y - y.mean(axis=0))) / (x @ x)
+
+                for feature, slope in zip(['Duration', 'Complexity', 'Resources'], slopes):
                     insights.append(f"Trend for {feature}: {'increasing' if slope > 0 else 'decreasing' if slope < 0 else 'stable' }.")
         except Exception as e:
             logger.error("Error analyzing trends: %s", e)
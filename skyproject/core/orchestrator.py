@@ -17,12 +17,35 @@ from skyproject.core.config import Config
 from skyproject.core.task_store import TaskStore
 from skyproject.irgat_ai.irgat_agent import IrgatAIAgent
 from skyproject.pm_ai.pm_agent import PMAIAgent
-from skyproject.shared.models import SystemState
+from skyproject.shared.models import Message, SystemState, TaskStatus
 from skyproject.core.self_improvement import SelfImprovementFeedbackLoop
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+_STATUS_COLORS = {
+    "pending": "yellow",
+    "in_progress": "blue",
+    "in_review": "magenta",
+    "completed": "green",
+    "failed": "red",
+    "cancelled": "dim",
+}
+
+_BANNER = """
+[bold cyan]
+ ███████╗██╗  ██╗██╗   ██╗██████╗ ██████╗  ██████╗      ██╗███████╗ ██████╗████████╗
+ ██╔════╝██║ ██╔╝╚██╗ ██╔╝██╔══██╗██╔══██╗██╔═══██╗     ██║██╔════╝██╔════╝╚══██╔══╝
+ ███████╗█████╔╝  ╚████╔╝ ██████╔╝██████╔╝██║   ██║     ██║█████╗  ██║        ██║
+ ╚════██║██╔═██╗   ╚██╔╝  ██╔═══╝ ██╔══██╗██║   ██║██   ██║██╔══╝  ██║        ██║
+ ███████║██║  ██╗   ██║   ██║     ██║  ██║╚██████╔╝╚█████╔╝███████╗╚██████╗   ██║
+ ╚══════╝╚═╝  ╚═╝   ╚═╝   ╚═╝     ╚═╝  ╚═╝ ╚═════╝  ╚════╝ ╚══════╝ ╚═════╝   ╚═╝
+[/bold cyan]
+[bold white]  PM AI plans. IrgatAI builds. Both evolve. Continuously.[/bold white]
+[dim]  Vector DB: cost-optimized context retrieval[/dim]
+[dim]  Press Ctrl+C to stop gracefully.[/dim]
+"""
+
 CycleHook = Callable[[int, dict], Coroutine[Any, Any, None]]
 
 
@@ -39,34 +62,46 @@ class Orchestrator:
         self.state = SystemState()
         self._running = False
         self._paused = False
+        # Set while running; run() parks on it while paused instead of polling
+        self._pause_event = asyncio.Event()
+        self._pause_event.set()
         self._start_time = 0.0
+        self._last_index_ts = 0.0
         self._cycle_hooks: list[CycleHook] = []
         self.telegram_bot: Optional[Any] = None
+        self.bus.subscribe("self_improve", self._count_improvement)
+
+    def _count_improvement(self, message: Message) -> None:
+        self.state.total_improvements += 1
 
     def add_cycle_hook(self, hook: CycleHook) -> None:
         self._cycle_hooks.append(hook)
 
     def pause(self) -> None:
         self._paused = True
+        self._pause_event.clear()
         logger.info("Orchestrator paused")
 
     def resume(self) -> None:
         self._paused = False
+        self._pause_event.set()
         logger.info("Orchestrator resumed")
 
     async def _fire_cycle_hooks(self, cycle_num: int, result: dict) -> None:
-        for hook in self._cycle_hooks:
-            try:
-                await hook(cycle_num, result)
-            except Exception as e:
-                logger.error("Cycle hook error: %s", e)
+        # Hooks are independent (Telegram, metrics, ...); run their I/O concurrently
+        results = await asyncio.gather(
+            *(hook(cycle_num, result) for hook in self._cycle_hooks), return_exceptions=True
+        )
+        for outcome in results:
+            if isinstance(outcome, Exception):
+                logger.error("Cycle hook error: %s", outcome)
 
     async def run(self) -> None:
         """Main run loop."""
         self._running = True
         self._start_time = time.time()
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, self._shutdown)
 
@@ -77,12 +112,15 @@ class Orchestrator:
 
         console.print("[dim]Ensuring codebase is indexed...[/dim]")
         self.code_index.ensure_indexed()
+        # Files edited while the process was down are newer than the last completed index pass
+        self._last_index_ts = self.code_index.last_indexed_at()
         console.print(f"[green]Index ready: {self.code_index.store.count} chunks[/green]\n")
 
+        improve_every = Config.SELF_IMPROVE_EVERY_N_CYCLES
         while self._running:
-            if self._paused:
-                await asyncio.sleep(2)
-                continue
+            await self._pause_event.wait()
+            if not self._running:
+                break
 
             try:
                 result = await self._run_cycle()
@@ -99,15 +137,19 @@ class Orchestrator:
                 if self.state.cycle_count % 5 == 0:
                     await self._print_status()
 
-                if self.state.cycle_count % Config.SELF_IMPROVE_EVERY_N_CYCLES == 0:
+                if self.state.cycle_count % improve_every == 0:
                     await self.self_improvement.review_and_propose_improvements()
                     await self.self_improvement.track_and_refine_improvement_proposals()
-                    self.code_index.index_all()
+                    index_started = time.time()
+                    self.code_index.reindex_changed_since(self._last_index_ts)
+                    self._last_index_ts = index_started
 
+                # Read once per cycle rather than once at startup: the web config page can change it live
+                cycle_interval = Config.CYCLE_INTERVAL
                 console.print(
-                    f"\n[dim]Sleeping {Config.CYCLE_INTERVAL}s before next cycle...[/dim]"
+                    f"\n[dim]Sleeping {cycle_interval}s before next cycle...[/dim]"
                 )
-                await asyncio.sleep(Config.CYCLE_INTERVAL)
+                await asyncio.sleep(cycle_interval)
 
             except asyncio.CancelledError:
                 break
@@ -117,6 +159,7 @@ class Orchestrator:
 
         if self.telegram_bot:
             await self.telegram_bot.stop()
+        await self.bus.close()
         console.print("\n[bold]SkyProject shutting down gracefully.[/bold]")
 
     async def run_single_cycle(self) -> dict[str, Any]:
@@ -139,19 +182,24 @@ class Orchestrator:
             )
         )
 
-        pm_result = await self.pm.run_cycle()
-        irgat_result = await self.irgat.run_cycle()
-
-        completed = await self.task_store.get_completed()
-        self.state.total_tasks_completed = len(completed)
+        # Reviews and assignment have to land before IrgatAI drains its queue, and reviews touch
+        # the same tasks IrgatAI executes. PM's self-improvement only edits PM's own code, so its
+        # LLM calls overlap with IrgatAI's execution.
+        pm_result = self.pm.start_cycle()
+        await self.pm.review_incoming(pm_result)
+        await self.pm.assign_tasks(pm_result)
+        _, irgat_result = await asyncio.gather(
+            self.pm.self_improve(pm_result),
+            self.irgat.run_cycle(),
+        )
 
-        for action in pm_result.get("actions", []) + irgat_result.get("actions", []):
-            if action.get("type") == "self_improve":
-                self.state.total_improvements += 1
+        self.state.total_tasks_completed = await self.task_store.count_status(TaskStatus.COMPLETED)
 
         return {"pm": pm_result, "irgat": irgat_result}
 
     async def _print_status(self) -> None:
+        if not self.task_store.consume_dirty():
+            return
         counts = await self.task_store.count_by_status()
 
         table = Table(title="Task Status", border_style="cyan")
@@ -159,34 +207,15 @@ class Orchestrator:
         table.add_column("Count", justify="right")
 
         for status, count in counts.items():
-            color = {
-                "pending": "yellow",
-                "in_progress": "blue",
-                "in_review": "magenta",
-                "completed": "green",
-                "failed": "red",
-                "cancelled": "dim",
-            }.get(status, "white")
+            color = _STATUS_COLORS.get(status, "white")
             table.add_row(f"[{color}]{status}[/{color}]", str(count))
 
         console.print(table)
 
     def _print_banner(self) -> None:
-        banner = """
-[bold cyan]
- ███████╗██╗  ██╗██╗   ██╗██████╗ ██████╗  ██████╗      ██╗███████╗ ██████╗████████╗
- ██╔════╝██║ ██╔╝╚██╗ ██╔╝██╔══██╗██╔══██╗██╔═══██╗     ██║██╔════╝██╔════╝╚══██╔══╝
- ███████╗█████╔╝  ╚████╔╝ ██████╔╝██████╔╝██║   ██║     ██║█████╗  ██║        ██║
- ╚════██║██╔═██╗   ╚██╔╝  ██╔═══╝ ██╔══██╗██║   ██║██   ██║██╔══╝  ██║        ██║
- ███████║██║  ██╗   ██║   ██║     ██║  ██║╚██████╔╝╚█████╔╝███████╗╚██████╗   ██║
- ╚══════╝╚═╝  ╚═╝   ╚═╝   ╚═╝     ╚═╝  ╚═╝ ╚═════╝  ╚════╝ ╚══════╝ ╚═════╝   ╚═╝
-[/bold cyan]
-[bold white]  PM AI plans. IrgatAI builds. Both evolve. Continuously.[/bold white]
-[dim]  Vector DB: cost-optimized context retrieval[/dim]
-[dim]  Press Ctrl+C to stop gracefully.[/dim]
-"""
-        console.print(banner)
+        console.print(_BANNER)
 
     def _shutdown(self) -> None:
         console.print("\n[bold yellow]Shutdown signal received...[/bold yellow]")
         self._running = False
+        self._pause_event.set()  # wake a paused run() so it can exit
@@ -34,12 +34,15 @@ class SelfImprovementFeedbackLoop:
         """
         Review and propose improvements based on feedback, failure analysis, ML insights, and sentiment analysis.
         """
-        feedback_suggestions = FeedbackAnalysis.suggest_improvements(await self.analyze_task_outcomes())
-        failure_analysis = FeedbackAnalysis.detailed_failure_analysis(await self.task_store.get_all())
-        refined_suggestions = FeedbackAnalysis.refine_suggestions(failure_analysis)
-        sentiment_results = FeedbackAnalysis.perform_sentiment_analysis(await self.task_store.get_all())
-        sentiment_suggestions = FeedbackAnalysis.interpret_sentiment_results(sentiment_results)
-        ml_insights = MLInsights.analyze_patterns(await self.task_store.get_all())
+        tasks = await self.task_store.get_all()
+        # The two CPU-bound passes only read the task list; run them off the loop together
+        report, ml_insights = await asyncio.gather(
+            asyncio.to_thread(FeedbackAnalysis.analyze_all, tasks),
+            asyncio.to_thread(MLInsights.analyze_patterns, tasks),
+        )
+        feedback_suggestions = FeedbackAnalysis.suggest_improvements(report.feedback)
+        refined_suggestions = FeedbackAnalysis.refine_suggestions(report.failures)
+        sentiment_suggestions = FeedbackAnalysis.interpret_sentiment_results(report.sentiment)
 
         suggestions = feedback_suggestions + refined_suggestions + sentiment_suggestions + ml_insights
 
@@ -53,17 +56,19 @@ class SelfImprovementFeedbackLoop:
         if refined_suggestions:
             await self.message_bus.send(Message(id="refined_proposal", sender="self_improvement", receiver="pm", msg_type="refined_proposal", content={"suggestions": refined_suggestions}))
 
-    async def monitor_feedback(self) -> None:
+    async def monitor_feedback(self, interval: float = 60.0) -> None:
         """
         Continuously monitor feedback and propose improvements.
+        :param interval: Seconds to wait between reviews, including after a failed one.
         """
         self._monitoring = True
         while self._monitoring:
             try:
                 await self.review_and_propose_improvements()
-                await asyncio.sleep(60)  # Adjust as appropriate
             except Exception as e:
                 logger.error("Error in feedback monitoring loop: %s", e)
+            if self._monitoring:
+                await asyncio.sleep(interval)
 
     def stop_monitoring(self) -> None:
         """
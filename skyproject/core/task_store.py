@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Optional
 
-import aiofiles
+from pydantic import ValidationError
 
 from skyproject.core.config import TASKS_DIR, Config
 from skyproject.shared.models import Task, TaskStatus
@@ -20,28 +23,160 @@ class TaskStore:
     def __init__(self, store_dir: Optional[Path] = None):
         self.store_dir = store_dir or TASKS_DIR
         self.store_dir.mkdir(parents=True, exist_ok=True)
+        # task id -> ((mtime_ns, size), Task); a file is re-parsed only when its stamp changes.
+        # Callers always get their own copy, so unsaved edits never leak into the cache.
+        self._cache: dict[str, tuple[tuple[int, int], Task]] = {}
+        # Status index over the cached tasks, revalidated against the directory before each status query
+        self._by_status: dict[TaskStatus, set[str]] = {status: set() for status in TaskStatus}
+        self._status_of: dict[str, TaskStatus] = {}
+        # The web UI reads through this store from its own thread and event loop;
+        # cache and index are only touched with this held, never across an await.
+        self._lock = threading.Lock()
+        # Set on every write and cleared by consume_dirty()
+        self._tasks_dirty = True
+        # Saves waiting for the flusher: task id -> (snapshot, encoded JSON, waiters).
+        # A later save of the same id replaces the data and joins the waiters.
+        self._pending_writes: dict[str, tuple[Task, bytes, list[asyncio.Future]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def save(self, task: Task) -> None:
-        path = self.store_dir / f"{task.id}.json"
-        await self._write_to_file(path, task.model_dump_json(indent=2))
+        """Persist a task; returns once it is durably on disk.
+
+        Saves issued while a write is in flight are coalesced and written by one worker-thread job.
+        """
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending_writes.get(task.id)
+        waiters = pending[2] if pending else []
+        waiters.append(future)
+        self._pending_writes[task.id] = (task.model_copy(), task.model_dump_json().encode(), waiters)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_writes())
+        await future
+
+    async def _flush_writes(self) -> None:
+        while self._pending_writes:
+            batch, self._pending_writes = self._pending_writes, {}
+            items = [(self.store_dir / f"{task_id}.json", data) for task_id, (_, data, _) in batch.items()]
+            try:
+                results = await asyncio.to_thread(_atomic_write_many, items, Config.MAX_RETRIES)
+            except BaseException as e:
+                for _, _, waiters in batch.values():
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                raise
+            with self._lock:
+                for (task_id, (task, _, _)), result in zip(batch.items(), results):
+                    if isinstance(result, os.stat_result):
+                        self._remember(task_id, self._stamp(result), task)
+                        self._tasks_dirty = True
+            for (_, _, waiters), result in zip(batch.values(), results):
+                for waiter in waiters:
+                    if waiter.done():
+                        continue
+                    if isinstance(result, os.stat_result):
+                        waiter.set_result(None)
+                    else:
+                        waiter.set_exception(result)
 
     async def load(self, task_id: str) -> Optional[Task]:
         path = self.store_dir / f"{task_id}.json"
-        if not path.exists():
+        try:
+            stamp = self._stamp(path.stat())
+        except OSError:
+            with self._lock:
+                self._forget(task_id)
             return None
-        return await self._read_from_file(path)
+        return await self._load_cached(task_id, path, stamp)
 
     async def get_all(self) -> list[Task]:
-        tasks = []
-        for path in sorted(self.store_dir.glob("*.json")):
-            task = await self._read_from_file(path)
+        task_ids = await self._sync_with_disk()
+        with self._lock:
+            return [self._cache[task_id][1].model_copy() for task_id in task_ids if task_id in self._cache]
+
+    async def _sync_with_disk(self) -> list[str]:
+        """Bring cache and status index in line with the task directory; returns the live ids in file order.
+
+        Costs one scandir plus a stat per file; only new or changed files are re-parsed.
+        """
+        with os.scandir(self.store_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".json") and e.is_file()),
+                key=lambda e: e.name,
+            )
+        task_ids = [entry.name[:-5] for entry in entries]
+        stamps = [self._stamp(entry.stat()) for entry in entries]
+        with self._lock:
+            stale = [
+                (task_id, Path(entry.path), stamp)
+                for task_id, entry, stamp in zip(task_ids, entries, stamps)
+                if task_id not in self._cache or self._cache[task_id][0] != stamp
+            ]
+        loaded = []
+        if stale:
+            # One worker-thread job reads and parses every new or changed file
+            loaded = await asyncio.to_thread(_load_task_files, [path for _, path, _ in stale], Config.MAX_RETRIES)
+        with self._lock:
+            for (task_id, _, stamp), task in zip(stale, loaded):
+                if task:
+                    self._remember(task_id, stamp, task)
+                else:
+                    self._forget(task_id)
+            for task_id in self._cache.keys() - set(task_ids):
+                self._forget(task_id)
+        return task_ids
+
+    @staticmethod
+    def _stamp(st: os.stat_result) -> tuple[int, int]:
+        return st.st_mtime_ns, st.st_size
+
+    async def _load_cached(self, task_id: str, path: Path, stamp: tuple[int, int]) -> Optional[Task]:
+        with self._lock:
+            cached = self._cache.get(task_id)
+            if cached is not None and cached[0] == stamp:
+                return cached[1].model_copy()
+        task = await self._read_from_file(path)
+        with self._lock:
             if task:
-                tasks.append(task)
-        return tasks
+                self._remember(task_id, stamp, task)
+                return task.model_copy()
+            self._forget(task_id)
+        return None
+
+    # _remember/_forget keep cache and status index in step; callers hold self._lock
+
+    def _remember(self, task_id: str, stamp: tuple[int, int], task: Task) -> None:
+        self._cache[task_id] = (stamp, task)
+        old_status = self._status_of.get(task_id)
+        if old_status != task.status:
+            if old_status is not None:
+                self._by_status[old_status].discard(task_id)
+            self._by_status[task.status].add(task_id)
+            self._status_of[task_id] = task.status
+
+    def _forget(self, task_id: str) -> None:
+        self._cache.pop(task_id, None)
+        old_status = self._status_of.pop(task_id, None)
+        if old_status is not None:
+            self._by_status[old_status].discard(task_id)
+
+    async def _ensure_indexed(self) -> None:
+        # Cheap when nothing changed: stamps match the cache, so no file is read.
+        # Picks up files written, edited or removed outside this store.
+        await self._sync_with_disk()
 
     async def get_by_status(self, status: TaskStatus) -> list[Task]:
-        all_tasks = await self.get_all()
-        return [t for t in all_tasks if t.status == status]
+        """Tasks with the given status, loading only the matching files."""
+        await self._ensure_indexed()
+        with self._lock:
+            task_ids = sorted(self._by_status[status], key=lambda i: f"{i}.json")
+        tasks = []
+        for task_id in task_ids:
+            task = await self.load(task_id)
+            # A file edited outside this store may have moved to another status
+            if task and task.status == status:
+                tasks.append(task)
+        return tasks
 
     async def get_pending(self) -> list[Task]:
         return await self.get_by_status(TaskStatus.PENDING)
@@ -53,41 +188,89 @@ class TaskStore:
         return await self.get_by_status(TaskStatus.COMPLETED)
 
     async def update_status(self, task_id: str, status: TaskStatus) -> Optional[Task]:
+        # load() is a stat plus a cache hit for known tasks; skip the write for a no-op flip
         task = await self.load(task_id)
-        if task:
+        if task and task.status != status:
             task.status = status
             await self.save(task)
         return task
 
+    async def count_status(self, status: TaskStatus) -> int:
+        """Number of tasks with the given status, from the revalidated in-memory index."""
+        await self._ensure_indexed()
+        with self._lock:
+            return len(self._by_status[status])
+
+    def consume_dirty(self) -> bool:
+        """True if any task was saved since the last call; clears the flag."""
+        dirty, self._tasks_dirty = self._tasks_dirty, False
+        return dirty
+
     async def count_by_status(self) -> dict[str, int]:
-        all_tasks = await self.get_all()
-        counts: dict[str, int] = {}
-        for status in TaskStatus:
-            counts[status.value] = sum(1 for t in all_tasks if t.status == status)
-        return counts
-
-    async def _write_to_file(self, path: Path, data: str) -> None:
-        retries = Config.MAX_RETRIES
-        while retries > 0:
+        """Per-status counts from the in-memory index; only new or changed task files are read."""
+        await self._ensure_indexed()
+        with self._lock:
+            return {status.value: len(ids) for status, ids in self._by_status.items()}
+
+    async def _read_from_file(self, path: Path) -> Optional[Task]:
+        # One thread hop for open+read+parse, retries included
+        return await asyncio.to_thread(_load_task_file, path, Config.MAX_RETRIES)
+
+
+def _read_file(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _load_task_file(path: Path, retries: int) -> Optional[Task]:
+    """Read and validate one task file, retrying on I/O or validation errors."""
+    for _ in range(retries):
+        try:
+            # pydantic-core parses and validates the bytes in one step
+            return Task.model_validate_json(_read_file(path))
+        except (OSError, ValidationError) as e:
+            logger.error("Failed to load task from %s: %s", path, e)
+    return None
+
+
+def _load_task_files(paths: list[Path], retries: int) -> list[Optional[Task]]:
+    return [_load_task_file(path, retries) for path in paths]
+
+
+def _atomic_write_many(
+    items: list[tuple[Path, bytes]], retries: int
+) -> list[os.stat_result | OSError]:
+    """Write each (path, data) atomically, retrying on OSError; returns a stat or the last error per item."""
+    results: list[os.stat_result | OSError] = []
+    for path, data in items:
+        for attempt in range(retries):
             try:
-                async with aiofiles.open(path, "w") as f:
-                    await f.write(data)
-                return
+                results.append(_atomic_write(path, data))
+                break
             except OSError as e:
                 logger.error("Failed to save task to %s: %s", path, e)
-                retries -= 1
-                if retries == 0:
-                    raise
+                if attempt == retries - 1:
+                    results.append(e)
+    return results
 
-    async def _read_from_file(self, path: Path) -> Optional[Task]:
-        retries = Config.MAX_RETRIES
-        while retries > 0:
-            try:
-                async with aiofiles.open(path, "r") as f:
-                    data = json.loads(await f.read())
-                return Task(**data)
-            except (OSError, json.JSONDecodeError) as e:
-                logger.error("Failed to load task from %s: %s", path, e)
-                retries -= 1
-                if retries == 0:
-                    return None
+
+def _atomic_write(path: Path, data: bytes) -> os.stat_result:
+    """Write data to a temp file beside path, fsync it and rename it into place.
+
+    Readers never see a half-written task. Returns the stat of the new file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep task files readable like before
+        os.fsync(fd)
+        st = os.fstat(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+    return st
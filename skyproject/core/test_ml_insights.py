@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from datetime import timedelta
+from unittest.mock import patch
 from skyproject.core.ml_insights import MLInsights
 from skyproject.shared.models import Task
 
@@ -10,11 +11,11 @@ def test_analyze_patterns_empty_tasks():
 
 def test_analyze_patterns_with_data():
     tasks = [
-        Task(id="1", title="Task 1", description="Desc 1", status="completed", duration=MagicMock(total_seconds=MagicMock(return_value=3600)), complexity_level=3, resources_used=5),
-        Task(id="2", title="Task 2", description="Desc 2", status="failed", duration=MagicMock(total_seconds=MagicMock(return_value=7200)), complexity_level=2, resources_used=3)
+        Task(id="1", title="Task 1", description="Desc 1", status="completed", duration=timedelta(seconds=3600), complexity_level=3, resources_used=5),
+        Task(id="2", title="Task 2", description="Desc 2", status="failed", duration=timedelta(seconds=7200), complexity_level=2, resources_used=3)
     ]
 
-    with patch('skyproject.core.ml_insights.KMeans') as MockKMeans:
+    with patch('skyproject.core.ml_insights.MiniBatchKMeans') as MockKMeans:
         mock_kmeans_instance = MockKMeans.return_value
         mock_kmeans_instance.labels_ = [0, 1]
 
@@ -38,4 +39,4 @@ def test_prepare_data_with_invalid_data():
         Task(id="1", title="Task 1", description="Desc 1", status="completed", duration=None)
     ]
     data = MLInsights._prepare_data(tasks)
-    assert data == []
+    assert data.shape == (0, 3)
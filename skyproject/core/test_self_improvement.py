@@ -8,7 +8,7 @@ from skyproject.core.communication import MessageBus
 from skyproject.shared.models import TaskStatus, Message
 
 @pytest.fixture
-async def mock_task_store():
+def mock_task_store():
     store = MagicMock(TaskStore)
     store.count_by_status = AsyncMock(return_value={
         TaskStatus.COMPLETED.value: 8,
@@ -22,13 +22,13 @@ async def mock_task_store():
     return store
 
 @pytest.fixture
-async def mock_message_bus():
+def mock_message_bus():
     bus = MagicMock(MessageBus)
     bus.send = AsyncMock()
     return bus
 
 @pytest.fixture
-async def feedback_loop(mock_task_store, mock_message_bus):
+def feedback_loop(mock_task_store, mock_message_bus):
     return SelfImprovementFeedbackLoop(mock_task_store, mock_message_bus)
 
 @pytest.mark.asyncio
@@ -56,26 +56,25 @@ async def test_review_and_propose_improvements(feedback_loop, mock_message_bus):
 
 @pytest.mark.asyncio
 async def test_monitor_feedback(feedback_loop):
-    feedback_loop.review_and_propose_improvements = AsyncMock()
+    def review():
+        if feedback_loop.review_and_propose_improvements.call_count == 3:
+            feedback_loop.stop_monitoring()
 
-    monitoring_task = asyncio.create_task(feedback_loop.monitor_feedback())
+    feedback_loop.review_and_propose_improvements = AsyncMock(side_effect=review)
 
-    await asyncio.sleep(1)
-    feedback_loop.stop_monitoring()
+    await asyncio.wait_for(feedback_loop.monitor_feedback(interval=0), timeout=5)
 
-    await monitoring_task
-
-    feedback_loop.review_and_propose_improvements.assert_called()
+    assert feedback_loop.review_and_propose_improvements.call_count == 3
 
 @pytest.mark.asyncio
 async def test_monitor_feedback_exception_handling(feedback_loop):
-    feedback_loop.review_and_propose_improvements = AsyncMock(side_effect=Exception("Test exception"))
-
-    monitoring_task = asyncio.create_task(feedback_loop.monitor_feedback())
+    def review():
+        if feedback_loop.review_and_propose_improvements.call_count == 3:
+            feedback_loop.stop_monitoring()
+        raise Exception("Test exception")
 
-    await asyncio.sleep(1)
-    feedback_loop.stop_monitoring()
+    feedback_loop.review_and_propose_improvements = AsyncMock(side_effect=review)
 
-    await monitoring_task
+    await asyncio.wait_for(feedback_loop.monitor_feedback(interval=0), timeout=5)
 
-    feedback_loop.review_and_propose_improvements.assert_called()
\ No newline at end of file
+    assert feedback_loop.review_and_propose_improvements.call_count == 3
@@ -1,10 +1,11 @@
 import pytest
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from pathlib import Path
 
+from skyproject.core import task_store as task_store_module
 from skyproject.core.task_store import TaskStore
-from skyproject.shared.models import Task, TaskStatus
+from skyproject.shared.models import Task, TaskStatus, TaskType
 from skyproject.core.config import Config
 
 @pytest.fixture
@@ -13,7 +14,8 @@ async def task_store(tmp_path):
 
 @pytest.fixture
 async def sample_task():
-    return Task(id="1", title="Sample Task", description="This is a sample task.", status=TaskStatus.PENDING)
+    return Task(id="1", title="Sample Task", description="This is a sample task.", task_type=TaskType.FEATURE,
+                status=TaskStatus.PENDING)
 
 @pytest.mark.asyncio
 async def test_save_task(task_store, sample_task):
@@ -62,15 +64,17 @@ async def test_count_by_status(task_store, sample_task):
 
 @pytest.mark.asyncio
 async def test_save_task_retry_logic(task_store, sample_task):
-    with patch('aiofiles.open', side_effect=OSError("Mocked error")) as mock_open:
+    with patch.object(task_store_module, '_atomic_write', side_effect=OSError("Mocked error")) as mock_write:
         with pytest.raises(OSError):
             await task_store.save(sample_task)
-        assert mock_open.call_count == Config.MAX_RETRIES
+        assert mock_write.call_count == Config.MAX_RETRIES
 
 @pytest.mark.asyncio
 async def test_load_task_retry_logic(task_store, sample_task):
     await task_store.save(sample_task)
-    with patch('aiofiles.open', side_effect=[OSError("Mocked error"), MagicMock()]) as mock_open:
+    task_store._cache.clear()  # force a disk read
+    data = (task_store.store_dir / f"{sample_task.id}.json").read_bytes()
+    with patch.object(task_store_module, '_read_file', side_effect=[OSError("Mocked error"), data]) as mock_read:
         loaded_task = await task_store.load(sample_task.id)
         assert loaded_task == sample_task
-        assert mock_open.call_count == 2
+        assert mock_read.call_count == 2
@@ -8,6 +8,11 @@ class AnomalyDetector:
         self.method = method
         self.kwargs = kwargs
         self.detector = self._initialize_detector()
+        # Resolve the per-method entry points once instead of comparing strings on every call
+        if self.method == 'dbscan':
+            self._predict, self._fit_predict = self._dbscan_labels, self._dbscan_fit_labels
+        else:
+            self._predict, self._fit_predict = self.detector.predict, self.detector.fit_predict
 
     def _initialize_detector(self):
         if self.method == 'isolation_forest':
@@ -19,31 +24,18 @@ class AnomalyDetector:
         else:
             raise ValueError(f'Unknown method: {self.method}')
 
-    def fit(self, X):
-        if not isinstance(X, np.ndarray):
-            raise ValueError('Input data must be a numpy array')
+    def _dbscan_labels(self, X):
+        return self.detector.labels_
+
+    def _dbscan_fit_labels(self, X):
         self.detector.fit(X)
+        return self.detector.labels_
+
+    def fit(self, X):
+        self.detector.fit(np.asarray(X, dtype=np.float32))
 
     def predict(self, X):
-        if not isinstance(X, np.ndarray):
-            raise ValueError('Input data must be a numpy array')
-        if self.method == 'isolation_forest' or self.method == 'one_class_svm':
-            return self.detector.predict(X)
-        elif self.method == 'dbscan':
-            core_samples_mask = np.zeros_like(self.detector.labels_, dtype=bool)
-            core_samples_mask[self.detector.core_sample_indices_] = True
-            labels = self.detector.labels_
-            return labels
-        else:
-            raise ValueError(f'Unknown method: {self.method}')
+        return self._predict(np.asarray(X, dtype=np.float32))
 
     def fit_predict(self, X):
-        if not isinstance(X, np.ndarray):
-            raise ValueError('Input data must be a numpy array')
-        if self.method == 'isolation_forest' or self.method == 'one_class_svm':
-            return self.detector.fit_predict(X)
-        elif self.method == 'dbscan':
-            self.detector.fit(X)
-            return self.predict(X)
-        else:
-            raise ValueError(f'Unknown method: {self.method}')
+        return self._fit_predict(np.asarray(X, dtype=np.float32))
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from skyproject.irgat_ai.exceptions import JSONDecodeError, CoderError
 from skyproject.shared.llm_client import LLMClient
@@ -12,32 +12,37 @@ from skyproject.core.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are filled with str.format_map; literal JSON braces are doubled.
+IMPLEMENT_TEMPLATE = """Implement the following task:
 
-class Coder:
-    """Generates code changes based on task descriptions using LLM."""
+Title: {title}
+Description: {description}
+Target module: {target_module}
 
-    def __init__(self, llm: LLMClient, code_index=None):
-        self.llm = llm
-        self._code_index = code_index
+Relevant codebase context:
+{context}
 
-    async def implement(self, task: Task) -> list[CodeChange]:
-        """Generate code changes for a task."""
-        try:
-            context = ""
-            if self._code_index:
-                context = self._code_index.get_context_for_task(
-                    f"{task.title}: {task.description}",
-                    module=task.target_module or None,
-                    max_tokens=2000,
-                )
+Respond with JSON:
+{{
+    "changes": [
+        {{
+            "file_path": "path/to/file.py",
+            "new_content": "complete file content",
+            "change_type": "modify"
+        }}
+    ]
+}}"""
 
-            prompt = f"""Implement the following task:
+REVISE_TEMPLATE = """Revise your implementation based on review feedback:
 
-Title: {task.title}
-Description: {task.description}
-Target module: {task.target_module}
+Task: {title}
+Description: {description}
 
-Relevant codebase context:
+Feedback: {feedback}
+Suggestions:
+{suggestions}
+
+Relevant context:
 {context}
 
 Respond with JSON:
@@ -45,12 +50,47 @@ Respond with JSON:
     "changes": [
         {{
             "file_path": "path/to/file.py",
-            "new_content": "complete file content",
+            "new_content": "complete revised file content",
             "change_type": "modify"
         }}
     ]
 }}"""
 
+
+class Coder:
+    """Generates code changes based on task descriptions using LLM."""
+
+    def __init__(self, llm: LLMClient, code_index=None):
+        self.llm = llm
+        self._code_index = code_index
+
+    async def build_prompt(self, task: Task) -> str:
+        """Build the implementation prompt for a task.
+
+        The context lookup runs on the event loop: the code index and its context
+        cache are not thread-safe, so lookups must never overlap each other.
+        """
+        context = ""
+        if self._code_index:
+            context = self._code_index.get_context_for_task(
+                f"{task.title}: {task.description}",
+                module=task.target_module or None,
+                max_tokens=2000,
+            )
+
+        return IMPLEMENT_TEMPLATE.format_map({
+            "title": task.title,
+            "description": task.description,
+            "target_module": task.target_module,
+            "context": context,
+        })
+
+    async def implement(self, task: Task, prompt: Optional[str] = None) -> list[CodeChange]:
+        """Generate code changes for a task, reusing a prebuilt prompt if given."""
+        try:
+            if prompt is None:
+                prompt = await self.build_prompt(task)
+
             result = await self.llm.generate_json(Config.IRGAT_SYSTEM_PROMPT, prompt)
             changes = []
             for c in result.get("changes", []):
@@ -83,28 +123,13 @@ Respond with JSON:
 
             suggestions_text = "\n".join(f"- {s}" for s in suggestions) if suggestions else "None"
 
-            prompt = f"""Revise your implementation based on review feedback:
-
-Task: {task.title}
-Description: {task.description}
-
-Feedback: {feedback}
-Suggestions:
-{suggestions_text}
-
-Relevant context:
-{context}
-
-Respond with JSON:
-{{
-    "changes": [
-        {{
-            "file_path": "path/to/file.py",
-            "new_content": "complete revised file content",
-            "change_type": "modify"
-        }}
-    ]
-}}"""
+            prompt = REVISE_TEMPLATE.format_map({
+                "title": task.title,
+                "description": task.description,
+                "feedback": feedback,
+                "suggestions": suggestions_text,
+                "context": context,
+            })
 
             result = await self.llm.generate_json(Config.IRGAT_SYSTEM_PROMPT, prompt)
             changes = []
@@ -1,8 +1,10 @@
 """Task execution coordinator for IrgatAI."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
+from typing import Optional
 
 from rich.console import Console
 
@@ -15,6 +17,9 @@ from skyproject.shared.models import CodeChange, Task, TaskStatus
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Upper bound on concurrent file writes per change set, to keep the default thread pool free
+MAX_PARALLEL_WRITES = 8
+
 
 class Executor:
     """Coordinates code generation, validation, and application."""
@@ -22,6 +27,33 @@ class Executor:
     def __init__(self, llm: LLMClient, code_index=None):
         self.coder = Coder(llm, code_index=code_index)
         self.tester = Tester()
+        self._prompts: dict[str, asyncio.Task[str]] = {}
+
+    def prefetch_prompt(self, task: Optional[Task]) -> None:
+        """Start building the prompt for the next queued task.
+
+        Call it only once the previous task's files are written and re-indexed,
+        so the prompt sees the codebase that task will actually run against.
+        """
+        if task is not None and task.id not in self._prompts:
+            self._prompts[task.id] = asyncio.create_task(self.coder.build_prompt(task))
+
+    def cancel_prefetched(self) -> None:
+        """Cancel and drop prompts that were prefetched but never used."""
+        for pending in self._prompts.values():
+            pending.cancel()
+        self._prompts.clear()
+
+    async def _write_changes(self, changes: list[CodeChange]) -> None:
+        """Write all changed files concurrently; a later change to the same path wins."""
+        latest = {change.file_path: change.new_content for change in changes}
+        limit = asyncio.Semaphore(MAX_PARALLEL_WRITES)
+
+        async def write(path: str, content: str) -> None:
+            async with limit:
+                await write_file(path, content)
+
+        await asyncio.gather(*(write(path, content) for path, content in latest.items()))
 
     async def execute_task(self, task: Task) -> Task:
         """Execute a task: generate code -> validate -> apply."""
@@ -32,7 +64,9 @@ class Executor:
             console.print(f"[yellow]Executing:[/yellow] {task.title}")
 
             console.print("  Generating code...")
-            changes = await self.coder.implement(task)
+            pending = self._prompts.pop(task.id, None)
+            prompt = await pending if pending is not None else None
+            changes = await self.coder.implement(task, prompt=prompt)
             console.print(f"  Generated {len(changes)} file change(s)")
 
             console.print("  Validating...")
@@ -40,8 +74,7 @@ class Executor:
 
             if valid:
                 console.print("  Applying changes...")
-                for change in changes:
-                    await write_file(change.file_path, change.new_content)
+                await self._write_changes(changes)
 
                 task.code_changes = changes
                 task.status = TaskStatus.IN_REVIEW
@@ -75,8 +108,7 @@ class Executor:
             valid = await self.tester.validate_changes(changes)
 
             if valid:
-                for change in changes:
-                    await write_file(change.file_path, change.new_content)
+                await self._write_changes(changes)
 
                 task.code_changes = changes
                 task.status = TaskStatus.IN_REVIEW
@@ -32,6 +32,11 @@ class IrgatAIAgent:
         self.self_improver = IrgatSelfImprover(self.llm, code_index=code_index)
         self.cycle_count = 0
         self._retry_counts: dict[str, int] = {}
+        # Messages produced during a cycle, sent together at its end (or the next one's, if it raised)
+        self._outgoing: list[Message] = []
+        # The task queued right after the message being handled; its prompt is prefetched once
+        # the current task's changes are written and re-indexed
+        self._next_task: Optional[Task] = None
 
     async def run_cycle(self) -> dict[str, Any]:
         """Run one IrgatAI cycle: receive tasks -> execute -> report."""
@@ -41,10 +46,16 @@ class IrgatAIAgent:
         console.print(f"\n[bold yellow]━━━ IrgatAI Cycle #{self.cycle_count} ━━━[/bold yellow]")
 
         messages = await self.bus.receive_all("irgat")
-        for msg in messages:
-            action = await self._handle_message(msg)
-            if action:
-                cycle_result["actions"].append(action)
+        try:
+            for msg, following in zip(messages, messages[1:] + [None]):
+                is_task = following is not None and following.msg_type == "task_assign"
+                self._next_task = Task(**following.payload) if is_task else None
+                action = await self._handle_message(msg)
+                if action:
+                    cycle_result["actions"].append(action)
+        finally:
+            self._next_task = None
+            self.executor.cancel_prefetched()
 
         if self.cycle_count % Config.SELF_IMPROVE_EVERY_N_CYCLES == 0 and Config.AUTO_IMPROVE:
             console.print("[yellow]IrgatAI self-improvement analysis...[/yellow]")
@@ -53,23 +64,40 @@ class IrgatAIAgent:
                 console.print(f"  [magenta]Self-improve:[/magenta] {proposal.title}")
                 await self.self_improver.apply_improvement(proposal)
                 cycle_result["actions"].append({"type": "self_improve", "title": proposal.title})
+                self._outgoing.append(Message(
+                    sender="irgat",
+                    receiver="orchestrator",
+                    msg_type="self_improve",
+                    payload={"title": proposal.title},
+                ))
+
+        await self._flush_outgoing()
 
         return cycle_result
 
+    async def _flush_outgoing(self) -> None:
+        if self._outgoing:
+            outgoing, self._outgoing = self._outgoing, []
+            await self.bus.send_many(outgoing)
+
+    def _reindex_changes(self, task: Task) -> None:
+        if self.code_index and task.code_changes:
+            self.code_index.index_files([(change.file_path, change.new_content) for change in task.code_changes])
+
     async def _handle_message(self, msg: Message) -> Optional[dict[str, Any]]:
         if msg.msg_type == "task_assign":
             task = Task(**msg.payload)
             console.print(f"[yellow]Received task:[/yellow] {task.title}")
 
             result_task = await self.executor.execute_task(task)
-            await self.task_store.save(result_task)
 
-            if self.code_index and result_task.code_changes:
-                for change in result_task.code_changes:
-                    self.code_index.index_file(change.file_path, change.new_content)
+            self._reindex_changes(result_task)
+            # Files are written and re-indexed; the next prompt builds while the task is saved
+            self.executor.prefetch_prompt(self._next_task)
+            await self.task_store.save(result_task)
 
             if result_task.status == TaskStatus.IN_REVIEW:
-                await self.bus.send(Message(
+                self._outgoing.append(Message(
                     sender="irgat",
                     receiver="pm",
                     msg_type="review_request",
@@ -77,7 +105,7 @@ class IrgatAIAgent:
                 ))
                 return {"type": "executed", "task": task.title, "status": "in_review"}
             else:
-                await self.bus.send(Message(
+                self._outgoing.append(Message(
                     sender="irgat",
                     receiver="pm",
                     msg_type="status_update",
@@ -101,10 +129,12 @@ class IrgatAIAgent:
                             msg.payload.get("feedback", ""),
                             msg.payload.get("suggestions", []),
                         )
+                        self._reindex_changes(result_task)
+                        self.executor.prefetch_prompt(self._next_task)
                         await self.task_store.save(result_task)
 
                         if result_task.status == TaskStatus.IN_REVIEW:
-                            await self.bus.send(Message(
+                            self._outgoing.append(Message(
                                 sender="irgat",
                                 receiver="pm",
                                 msg_type="review_request",
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-
 from skyproject.core.config import Config
 from skyproject.shared.file_ops import save_snapshot, write_file
 from skyproject.shared.llm_client import LLMClient
@@ -11,6 +10,9 @@ from skyproject.shared.models import CodeChange, ImprovementProposal
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after each failed attempt; one more attempt than entries
+_RETRY_DELAYS = (1.0, 2.0)
+
 
 class IrgatSelfImprover:
     """IrgatAI analyzes and improves its own code using vector-search for cost efficiency."""
@@ -41,19 +43,16 @@ class IrgatSelfImprover:
                 "feedback processing and revision workflow",
             ]
 
+            # One batched vector query for all areas instead of one search per area
+            contexts = self.code_index.get_contexts_for_tasks(improvement_areas, module="irgat_ai", max_tokens=600)
             relevant_context = ""
-            for area in improvement_areas:
-                ctx = self.code_index.get_context_for_task(area, module="irgat_ai", max_tokens=600)
+            for area, ctx in zip(improvement_areas, contexts):
                 if ctx:
                     relevant_context += f"\n## Area: {area}\n{ctx}\n"
 
-            prompt = f"""Analyze the IrgatAI module and propose specific improvements.
-
-Module structure:
-{module_summary}
-
-Relevant code sections:
-{relevant_context}
+            # Stable instructions and module summary first so providers can cache the prefix;
+            # the per-call code sections go last
+            cached_prefix = f"""Analyze the IrgatAI module and propose specific improvements.
 
 Identify 1-3 concrete improvements. Focus on:
 1. Better code generation strategies
@@ -81,9 +80,16 @@ Respond with JSON:
             ]
         }}
     ]
-}}"""
+}}
+
+Module structure:
+{module_summary}
+"""
+            prompt = f"""
+Relevant code sections:
+{relevant_context}"""
 
-            result = await self.llm.generate_json(Config.IRGAT_SYSTEM_PROMPT, prompt)
+            result = await self.llm.generate_json(Config.IRGAT_SYSTEM_PROMPT, prompt, cached_prefix=cached_prefix)
             proposals = self._parse_proposals(result)
             return proposals
         except Exception as e:
@@ -117,10 +123,13 @@ Respond with JSON:
         """Apply an improvement with safety snapshot and re-index."""
         await save_snapshot("skyproject/irgat_ai", f"irgat_pre_{proposal.id}")
 
+        written: list[tuple[str, str]] = []
         try:
             for change in proposal.proposed_changes:
                 await self._execute_with_retry(write_file, change.file_path, change.new_content)
-                self.code_index.index_file(change.file_path, change.new_content)
+                written.append((change.file_path, change.new_content))
+            files, written = written, []
+            self.code_index.index_files(files)
             proposal.status = "implemented"
             return True
         except FileNotFoundError as e:
@@ -135,7 +144,16 @@ Respond with JSON:
             logger.error("Error applying improvement '%s': %s", proposal.title, e, exc_info=True)
             proposal.status = "rejected"
             return False
+        finally:
+            if written:
+                # A later write failed; the files already on disk still need re-indexing
+                self.code_index.index_files(written)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), reraise=True)
     async def _execute_with_retry(self, func, *args, **kwargs):
+        for delay in _RETRY_DELAYS:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.warning("Retrying %s in %.0fs after error: %s", getattr(func, "__name__", func), delay, e)
+                await asyncio.sleep(delay)
         return await func(*args, **kwargs)
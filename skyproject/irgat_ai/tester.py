@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import ast
-import asyncio
+import hashlib
 import logging
 import traceback
+from collections import OrderedDict
+from typing import Optional
 
 from skyproject.shared.models import CodeChange
 
@@ -14,41 +16,49 @@ logger = logging.getLogger(__name__)
 class Tester:
     """Validates code changes before they are applied."""
 
+    SYNTAX_CACHE_SIZE = 512
+
+    def __init__(self):
+        # blake2b digest of file content -> None if it parsed, else (lineno, msg) of the error.
+        # Retries and repeated proposals resubmit identical files, which then skip the parser.
+        self._syntax_cache: OrderedDict[bytes, Optional[tuple[Optional[int], str]]] = OrderedDict()
+
     async def validate_changes(self, changes: list[CodeChange]) -> bool:
         """Validate all code changes via syntax checking."""
         if not changes:
             return False
 
-        tasks = [self._check_syntax(change) for change in changes]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_valid = True
-        for change, result in zip(changes, results):
-            if isinstance(result, Exception):
-                logger.error(
-                    "Validation failed for %s: %s",
-                    change.file_path, result,
-                )
-                all_valid = False
-            elif not result:
-                all_valid = False
-
-        return all_valid
+        # Parsing holds the GIL, so a plain loop beats scheduling one task per file;
+        # every change is still checked so each error gets logged
+        results = [self._check_syntax(change) for change in changes]
+        return all(results)
 
-    async def _check_syntax(self, change: CodeChange) -> bool:
+    def _check_syntax(self, change: CodeChange) -> bool:
         """Check if the code has valid Python syntax."""
         if not change.file_path.endswith(".py"):
             return True
 
-        try:
-            ast.parse(change.new_content)
-            return True
-        except SyntaxError as e:
+        digest = hashlib.blake2b(change.new_content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        if digest in self._syntax_cache:
+            self._syntax_cache.move_to_end(digest)
+            error = self._syntax_cache[digest]
+        else:
+            try:
+                compile(change.new_content, change.file_path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+                error = None
+            except SyntaxError as e:
+                error = (e.lineno, e.msg)
+            except Exception as e:
+                logger.error("Unexpected validation error: %s", e, exc_info=True)
+                return False
+            self._syntax_cache[digest] = error
+            if len(self._syntax_cache) > self.SYNTAX_CACHE_SIZE:
+                self._syntax_cache.popitem(last=False)
+
+        if error is not None:
             logger.warning(
                 "Syntax error in %s at line %s: %s",
-                change.file_path, e.lineno, e.msg,
+                change.file_path, error[0], error[1],
             )
             return False
-        except Exception as e:
-            logger.error("Unexpected validation error: %s", e, exc_info=True)
-            return False
+        return True
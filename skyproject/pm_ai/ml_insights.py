@@ -1,17 +1,23 @@
-import pandas as pd
+import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 
 class MLInsights:
     def __init__(self):
-        self.model = RandomForestClassifier()
+        self.model = RandomForestClassifier(n_jobs=-1)
         # Assuming model training happens elsewhere, for simplicity
 
-    def get_insights(self, tasks):
-        features = self._extract_features(tasks)
+    def get_insights(self, tasks, features=None):
+        # Callers that already hold the (n, 2) feature rows can pass them to skip extraction
+        if features is None:
+            features = self._extract_features(tasks)
         predictions = self.model.predict(features)
         return {task['id']: prediction for task, prediction in zip(tasks, predictions)}
 
     def _extract_features(self, tasks):
         # This function should convert task data into a feature matrix
         # For demonstration, assume tasks have 'feature1' and 'feature2'
-        return pd.DataFrame([{ 'feature1': task['feature1'], 'feature2': task['feature2']} for task in tasks])
+        features = np.empty((len(tasks), 2), dtype=np.float32)
+        for i, task in enumerate(tasks):
+            features[i, 0] = task['feature1']
+            features[i, 1] = task['feature2']
+        return features
@@ -1,3 +1,11 @@
+import numpy as np
+import pandas as pd
+
+HISTORICAL_KEYS = (
+    'feature1', 'feature2', 'impact', 'completion_time',
+    'resource_availability', 'urgency', 'stakeholder_priority',
+)
+
 class Planner:
     def __init__(self):
         self.ml_insights = MLInsights()
@@ -11,13 +19,23 @@ class Planner:
             dependency_analysis = visualizer.analyze_dependency_complexity()
             logging.info('Dependency analysis: %s', dependency_analysis)
 
-            # New clustering logic
-            clustered_tasks = self._cluster_tasks(tasks)
-            for cluster in clustered_tasks:
-                insights = self.ml_insights.get_insights(cluster)
+            # One pass fills the historical matrix; each cluster then reuses a slice of it
+            # for both the ML features and the prioritizer's history
+            data = self._historical_matrix(tasks)
+            # Incomplete rows would otherwise cluster and train as if their gaps were real values
+            complete = ~np.isnan(data).any(axis=1)
+            if not complete.all():
+                logging.warning(
+                    'Skipping %d task(s) with incomplete historical data: %s',
+                    int((~complete).sum()),
+                    [task.get('id', 'unknown') for task, ok in zip(tasks, complete) if not ok],
+                )
+            planned = [task for task, ok in zip(tasks, complete) if ok]
+            for cluster, rows in self._cluster_tasks(planned, data[complete]):
+                insights = self.ml_insights.get_insights(cluster, features=rows[:, :2])
                 logging.info('ML Insights for cluster: %s', insights)
 
-                historical_data = self._prepare_historical_data(cluster)
+                historical_data = pd.DataFrame(rows, columns=HISTORICAL_KEYS)
                 task_prioritizer = TaskPrioritizer(historical_data)
                 prioritized_tasks = task_prioritizer.prioritize_tasks(cluster)
 
@@ -37,16 +55,24 @@ class Planner:
             self._log_error(ErrorCode.PLANNER_ERROR, 'Error planning tasks', task_ids, e, tasks)
             raise
 
-    def _cluster_tasks(self, tasks):
-        # Basic clustering logic based on task features
-        clusters = defaultdict(list)
-        for task in tasks:
-            key = (task.get('feature1'), task.get('feature2'))
-            clusters[key].append(task)
-        return clusters.values()
+    def _cluster_tasks(self, tasks, data):
+        # Group tasks by (feature1, feature2), in order of first appearance. Rows are reordered
+        # once so every cluster's rows are a contiguous view of the reordered matrix.
+        _, first, inverse = np.unique(data[:, :2], axis=0, return_index=True, return_inverse=True)
+        cluster_ids = np.argsort(np.argsort(first))[inverse.ravel()]
+        order = np.argsort(cluster_ids, kind='stable')
+        rows = data[order]
+        start = 0
+        for stop in np.cumsum(np.bincount(cluster_ids)):
+            yield [tasks[i] for i in order[start:stop]], rows[start:stop]
+            start = stop
 
-    def _prepare_historical_data(self, tasks):
-        return pd.DataFrame([{k: task.get(k, 0) for k in ('feature1', 'feature2', 'impact', 'completion_time', 'resource_availability', 'urgency', 'stakeholder_priority')} for task in tasks])
+    def _historical_matrix(self, tasks):
+        # Fill one float64 block with a row of HISTORICAL_KEYS per task; missing or None values become NaN
+        data = np.empty((len(tasks), len(HISTORICAL_KEYS)), dtype=np.float64)
+        for i, task in enumerate(tasks):
+            data[i] = [np.nan if task.get(k) is None else task[k] for k in HISTORICAL_KEYS]
+        return data
 
     def _log_error(self, error_code, message, task_ids, error, tasks):
         logging.error(
@@ -37,17 +37,28 @@ class PMAIAgent:
 
     async def run_cycle(self) -> dict[str, Any]:
         """Run one PM AI cycle: analyze -> plan -> assign -> review."""
-        self.cycle_count += 1
-        cycle_result = {"cycle": self.cycle_count, "actions": []}
+        cycle_result = self.start_cycle()
+        await self.review_incoming(cycle_result)
+        await self.assign_tasks(cycle_result)
+        await self.self_improve(cycle_result)
+        return cycle_result
 
+    def start_cycle(self) -> dict[str, Any]:
+        """Begin a cycle and return the result dict the phases below append to."""
+        self.cycle_count += 1
         console.print(f"\n[bold blue]━━━ PM AI Cycle #{self.cycle_count} ━━━[/bold blue]")
+        return {"cycle": self.cycle_count, "actions": []}
 
+    async def review_incoming(self, cycle_result: dict[str, Any]) -> None:
+        """Handle queued messages (review requests) from IrgatAI."""
         messages = await self.bus.receive_all("pm")
         for msg in messages:
             action = await self._handle_message(msg)
             if action:
                 cycle_result["actions"].append(action)
 
+    async def assign_tasks(self, cycle_result: dict[str, Any]) -> None:
+        """Plan and assign new tasks when nothing is pending."""
         pending = await self.task_store.get_pending()
         if not pending:
             new_tasks = await self._plan_tasks()
@@ -62,6 +73,7 @@ class PMAIAgent:
                 console.print(f"  [blue]Assigned:[/blue] {task.title}")
                 cycle_result["actions"].append({"type": "assign", "task": task.title})
 
+    async def self_improve(self, cycle_result: dict[str, Any]) -> None:
         if self.cycle_count % Config.SELF_IMPROVE_EVERY_N_CYCLES == 0 and Config.AUTO_IMPROVE:
             console.print("[blue]PM AI self-improvement analysis...[/blue]")
             proposals = await self.self_improver.analyze_self()
@@ -69,8 +81,12 @@ class PMAIAgent:
                 console.print(f"  [magenta]Self-improve:[/magenta] {proposal.title}")
                 await self.self_improver.apply_improvement(proposal)
                 cycle_result["actions"].append({"type": "self_improve", "title": proposal.title})
-
-        return cycle_result
+                await self.bus.send(Message(
+                    sender="pm",
+                    receiver="orchestrator",
+                    msg_type="self_improve",
+                    payload={"title": proposal.title},
+                ))
 
     async def _plan_tasks(self) -> list[Task]:
         """Use LLM + vector search to analyze codebase and create tasks."""
@@ -40,19 +40,16 @@ class PMSelfImprover:
                 "error handling and resilience",
             ]
 
+            # One batched vector query for all areas instead of one search per area
+            contexts = self.code_index.get_contexts_for_tasks(improvement_areas, module="pm_ai", max_tokens=600)
             relevant_context = ""
-            for area in improvement_areas:
-                ctx = self.code_index.get_context_for_task(area, module="pm_ai", max_tokens=600)
+            for area, ctx in zip(improvement_areas, contexts):
                 if ctx:
                     relevant_context += f"\n## Area: {area}\n{ctx}\n"
 
-            prompt = f"""Analyze the PM AI module and propose specific improvements.
-
-Module structure:
-{module_summary}
-
-Relevant code sections:
-{relevant_context}
+            # Stable instructions and module summary first so providers can cache the prefix;
+            # the per-call code sections go last
+            cached_prefix = f"""Analyze the PM AI module and propose specific improvements.
 
 Focus on improving:
 1. Planning strategies
@@ -81,9 +78,15 @@ Respond with JSON:
         }}
     ]
 }}
+
+Module structure:
+{module_summary}
 """
+            prompt = f"""
+Relevant code sections:
+{relevant_context}"""
 
-            result = await self.llm.generate_json(Config.PM_SYSTEM_PROMPT, prompt)
+            result = await self.llm.generate_json(Config.PM_SYSTEM_PROMPT, prompt, cached_prefix=cached_prefix)
             proposals = []
             for p in result.get("proposals", []):
                 changes = [
@@ -113,13 +116,20 @@ Respond with JSON:
         """Apply an approved improvement, with snapshot for rollback."""
         await save_snapshot("skyproject/pm_ai", f"pm_pre_{proposal.id}")
 
+        written: list[tuple[str, str]] = []
         try:
             for change in proposal.proposed_changes:
                 await write_file(change.file_path, change.new_content)
-                self.code_index.index_file(change.file_path, change.new_content)
+                written.append((change.file_path, change.new_content))
+            files, written = written, []
+            self.code_index.index_files(files)
             proposal.status = "implemented"
             return True
         except Exception as e:
             logger.error("Failed to apply PM improvement: %s", e)
             proposal.status = "rejected"
             return False
+        finally:
+            if written:
+                # A later write failed; the files already on disk still need re-indexing
+                self.code_index.index_files(written)
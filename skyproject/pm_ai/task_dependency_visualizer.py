@@ -45,7 +45,7 @@ class TaskDependencyVisualizer:
         return visible_nodes
 
     async def _plotly_render(self, graph: nx.DiGraph, file_path: str) -> None:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._plotly_graph, graph, file_path)
 
     def _plotly_graph(self, graph: nx.DiGraph, file_path: str) -> None:
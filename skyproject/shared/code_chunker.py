@@ -133,14 +133,14 @@ class CodeChunker:
 
     def _get_module_level_lines(self, lines: list[str], class_func_ranges: list[tuple[int, int]]) -> str:
         """Extract imports, constants, and other module-level code outside classes/functions."""
-        occupied = set()
-        for start, end in class_func_ranges:
-            occupied.update(range(start, end + 1))
-
-        module_lines = []
-        for i, line in enumerate(lines, 1):
-            if i not in occupied:
-                module_lines.append(line)
+        # Slice the gaps between (sorted, 1-based, inclusive) ranges instead of testing every line.
+        module_lines: list[str] = []
+        cursor = 0
+        for start, end in sorted(class_func_ranges):
+            if start - 1 > cursor:
+                module_lines.extend(lines[cursor : start - 1])
+            cursor = max(cursor, end)
+        module_lines.extend(lines[cursor:])
 
         return "\n".join(module_lines)
 
@@ -5,6 +5,7 @@ import os
 import asyncio
 from typing import Any, Optional, Callable, Coroutine
 
+import orjson
 import requests
 from requests.exceptions import ConnectionError, HTTPError, Timeout, RequestException
 from dotenv import load_dotenv
@@ -12,6 +13,23 @@ from skyproject.shared.logging_utils import log_error, log_warning, log_info, Er
 
 load_dotenv()
 
+# SDK clients keyed by (constructor, api key); each wraps a pooled HTTP client, so
+# sharing them lets every LLMClient reuse the same keep-alive connections.
+_SDK_CLIENTS: dict[tuple[Any, Optional[str]], Any] = {}
+
+
+def _shared_sdk_client(factory: Callable[..., Any], api_key: Optional[str]) -> Any:
+    key = (factory, api_key)
+    client = _SDK_CLIENTS.get(key)
+    if client is None:
+        client = _SDK_CLIENTS[key] = factory(api_key=api_key)
+    return client
+
+
+def _log_cached_tokens(provider: str, cached_tokens: Any) -> None:
+    if isinstance(cached_tokens, int) and cached_tokens > 0:
+        log_info(f"{provider} prompt cache hit: {cached_tokens} cached input tokens")
+
 
 class LLMClientError(Exception):
     """Base class for exceptions in this module."""
@@ -48,13 +66,13 @@ class LLMClient:
     def _get_openai_client(self):
         if self._client is None:
             from openai import OpenAI
-            self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            self._client = _shared_sdk_client(OpenAI, os.getenv("OPENAI_API_KEY"))
         return self._client
 
     def _get_anthropic_client(self):
         if self._client is None:
             import anthropic
-            self._client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+            self._client = _shared_sdk_client(anthropic.Anthropic, os.getenv("ANTHROPIC_API_KEY"))
         return self._client
 
     async def generate(
@@ -62,13 +80,22 @@ class LLMClient:
         system_prompt: str,
         user_prompt: str,
         response_format: Optional[str] = None,
+        cached_prefix: str = "",
     ) -> str:
-        """Generate a response from the LLM with enhanced context."""
+        """Generate a response from the LLM with enhanced context.
+
+        ``cached_prefix`` is a stable leading part of the user message that is sent ahead of
+        ``user_prompt`` and marked for provider-side prompt caching.
+        """
         try:
             if self.provider == "openai":
-                return await self._generate_with_retries(self._generate_openai, system_prompt, user_prompt, response_format)
+                return await self._generate_with_retries(
+                    self._generate_openai, system_prompt, user_prompt, response_format, cached_prefix
+                )
             elif self.provider == "anthropic":
-                return await self._generate_with_retries(self._generate_anthropic, system_prompt, user_prompt)
+                return await self._generate_with_retries(
+                    self._generate_anthropic, system_prompt, user_prompt, cached_prefix
+                )
             else:
                 raise UnknownProviderError(self.provider)
         except LLMClientError as e:
@@ -79,12 +106,17 @@ class LLMClient:
             raise
 
     async def _generate_openai(
-        self, system_prompt: str, user_prompt: str, response_format: Optional[str] = None
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_format: Optional[str] = None,
+        cached_prefix: str = "",
     ) -> str:
         client = self._get_openai_client()
 
         enhanced_system_prompt = f"You are a sophisticated AI assistant. {system_prompt}"
-        enhanced_user_prompt = f"Provide a clear and concise response to the following: {user_prompt}"
+        # OpenAI caches the longest previously seen prefix automatically; keep the stable part first
+        enhanced_user_prompt = f"Provide a clear and concise response to the following: {cached_prefix}{user_prompt}"
 
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -101,6 +133,8 @@ class LLMClient:
 
         try:
             response = await asyncio.to_thread(client.chat.completions.create, **kwargs)
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            _log_cached_tokens("OpenAI", getattr(details, "cached_tokens", None))
             return response.choices[0].message.content or ""
         except ConnectionError as e:
             log_error(ErrorCode.NETWORK_ERROR, f"Network error in OpenAI generation: {str(e)}")
@@ -118,21 +152,31 @@ class LLMClient:
             log_error(ErrorCode.OPENAI_GENERATION_ERROR, f"Unexpected error in OpenAI generation: {str(e)}")
             raise
 
-    async def _generate_anthropic(self, system_prompt: str, user_prompt: str) -> str:
+    async def _generate_anthropic(self, system_prompt: str, user_prompt: str, cached_prefix: str = "") -> str:
         client = self._get_anthropic_client()
 
         enhanced_system_prompt = f"You are a sophisticated AI assistant. {system_prompt}"
-        enhanced_user_prompt = f"Provide a clear and concise response to the following: {user_prompt}"
+        instruction = "Provide a clear and concise response to the following: "
+        # Anthropic caches up to each cache_control breakpoint: the system prompt, then the stable prefix
+        system = [{"type": "text", "text": enhanced_system_prompt, "cache_control": {"type": "ephemeral"}}]
+        if cached_prefix:
+            content: Any = [
+                {"type": "text", "text": instruction + cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": user_prompt},
+            ]
+        else:
+            content = instruction + user_prompt
 
         try:
             response = await asyncio.to_thread(
                 client.messages.create,
                 model=self.model,
                 max_tokens=self.max_tokens,
-                system=enhanced_system_prompt,
-                messages=[{"role": "user", "content": enhanced_user_prompt}],
+                system=system,
+                messages=[{"role": "user", "content": content}],
                 temperature=self.temperature,
             )
+            _log_cached_tokens("Anthropic", getattr(response.usage, "cache_read_input_tokens", None))
             return response.content[0].text
         except ConnectionError as e:
             log_error(ErrorCode.NETWORK_ERROR, f"Network error in Anthropic generation: {str(e)}")
@@ -150,15 +194,18 @@ class LLMClient:
             log_error(ErrorCode.ANTHROPIC_GENERATION_ERROR, f"Unexpected error in Anthropic generation: {str(e)}")
             raise
 
-    async def generate_json(self, system_prompt: str, user_prompt: str) -> dict:
+    async def generate_json(self, system_prompt: str, user_prompt: str, cached_prefix: str = "") -> dict:
         """Generate and parse a JSON response."""
         try:
             if self.provider == "openai":
-                raw = await self.generate(system_prompt, user_prompt, response_format="json")
+                raw = await self.generate(
+                    system_prompt, user_prompt, response_format="json", cached_prefix=cached_prefix
+                )
             else:
                 raw = await self.generate(
                     system_prompt + "\n\nYou MUST respond with valid JSON only. No markdown, no explanation.",
                     user_prompt,
+                    cached_prefix=cached_prefix,
                 )
 
             raw = raw.strip()
@@ -166,7 +213,7 @@ class LLMClient:
                 lines = raw.split("\n")
                 raw = "\n".join(lines[1:-1])
 
-            return json.loads(raw)
+            return orjson.loads(raw)
         except json.JSONDecodeError as e:
             log_error(ErrorCode.JSON_DECODE_ERROR, f"Failed to decode JSON response: {str(e)}")
             raise
@@ -5,7 +5,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class TaskStatus(str, Enum):
@@ -113,6 +114,24 @@ class Message(BaseModel):
     payload: dict[str, Any]
     timestamp: datetime = Field(default_factory=datetime.now)
 
+    _wire: Optional[bytes] = PrivateAttr(default=None)
+
+    def to_wire(self) -> bytes:
+        """JSONL-encoded message, serialized once and reused for retries and re-logging.
+
+        Messages are treated as immutable once sent; the cache is not invalidated on mutation.
+        """
+        if self._wire is None:
+            self._wire = orjson.dumps(
+                self.model_dump(mode="python"), default=str, option=orjson.OPT_NON_STR_KEYS
+            ) + b"\n"
+        return self._wire
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Message:
+        copy = super().model_copy(update=update, deep=deep)
+        copy._wire = None  # private attrs are copied too; the copy may differ
+        return copy
+
 
 class SystemState(BaseModel):
     """Overall system state for monitoring."""
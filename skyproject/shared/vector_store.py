@@ -52,8 +52,12 @@ class CodeVectorStore:
     def _hash_content(content: str) -> str:
         return hashlib.md5(content.encode()).hexdigest()
 
-    def index_chunks(self, chunks: list[CodeChunk]) -> int:
-        """Index code chunks, skipping unchanged ones. Returns count of newly indexed."""
+    def index_chunks(self, chunks: list[CodeChunk], max_batch: int = 256) -> int:
+        """Index code chunks, skipping unchanged ones. Returns count of newly indexed.
+
+        Changed chunks are upserted in slices of ``max_batch`` so large trees stay within the
+        embedder's efficient batch size and Chroma's per-call limit.
+        """
         new_chunks = []
         for chunk in chunks:
             content_hash = self._hash_content(chunk.content)
@@ -79,7 +83,12 @@ class CodeVectorStore:
             for c, h in new_chunks
         ]
 
-        self._collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        for i in range(0, len(ids), max_batch):
+            self._collection.upsert(
+                ids=ids[i : i + max_batch],
+                documents=documents[i : i + max_batch],
+                metadatas=metadatas[i : i + max_batch],
+            )
 
         for chunk, h in new_chunks:
             self._content_hashes[chunk.chunk_id] = h
@@ -95,6 +104,22 @@ class CodeVectorStore:
         chunk_type_filter: Optional[str] = None,
     ) -> list[SearchResult]:
         """Search for relevant code chunks by semantic similarity."""
+        return self.search_many([query], n_results, module_filter, chunk_type_filter)[0]
+
+    def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        module_filter: Optional[str] = None,
+        chunk_type_filter: Optional[str] = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once: one embedding batch and one collection query.
+
+        Returns one result list per query, in the order given.
+        """
+        if not queries:
+            return []
+
         where_filter = {}
         if module_filter:
             where_filter["module"] = module_filter
@@ -102,7 +127,7 @@ class CodeVectorStore:
             where_filter["chunk_type"] = chunk_type_filter
 
         kwargs = {
-            "query_texts": [query],
+            "query_texts": list(queries),
             "n_results": min(n_results, self._collection.count() or 1),
         }
         if where_filter:
@@ -115,13 +140,16 @@ class CodeVectorStore:
             results = self._collection.query(**kwargs)
         except Exception as e:
             logger.error("Vector search failed: %s", e)
-            return []
-
-        search_results = []
-        if results and results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-                distance = results["distances"][0][i] if results["distances"] else 1.0
+            return [[] for _ in queries]
+
+        all_results: list[list[SearchResult]] = []
+        documents = (results or {}).get("documents") or []
+        for q in range(len(queries)):
+            search_results = []
+            docs = documents[q] if q < len(documents) else None
+            for i, doc in enumerate(docs or ()):
+                meta = results["metadatas"][q][i] if results["metadatas"] else {}
+                distance = results["distances"][q][i] if results["distances"] else 1.0
                 search_results.append(SearchResult(
                     content=doc,
                     file_path=meta.get("file_path", ""),
@@ -132,8 +160,9 @@ class CodeVectorStore:
                     relevance_score=1.0 - distance,
                     module=meta.get("module", ""),
                 ))
+            all_results.append(search_results)
 
-        return search_results
+        return all_results
 
     def search_by_module(self, module: str, query: str, n_results: int = 10) -> list[SearchResult]:
         """Search within a specific module."""
@@ -0,0 +1,75 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from skyproject.core.bootstrap import Bootstrap, ProjectDetector
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "pyproject.toml").write_text("")
+    (tmp_path / "manage.py").write_text("")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "App.js").write_text("")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_app.py").write_text("")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    (tmp_path / "pkg" / "__pycache__").mkdir()
+    (tmp_path / "pkg" / "__pycache__" / "mod.py").write_text("")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "secret.py").write_text("")
+    (tmp_path / ".github" / "workflows").mkdir(parents=True)
+    return tmp_path
+
+def test_detect_profile(project_dir: Path):
+    profile = ProjectDetector(project_dir).detect()
+    assert profile["primary_language"] == "python"
+    assert profile["frameworks"] == ["django", "react"]
+    assert profile["structure"] == {"directories": ["pkg", "src", "tests"], "files": ["manage.py", "pyproject.toml"]}
+    assert profile["has_tests"] is True
+    assert profile["has_ci"] is True
+    assert profile["has_git"] is False
+    assert profile["file_count"] == 3
+
+def test_detect_languages_by_extension(tmp_path: Path):
+    for i in range(4):
+        (tmp_path / f"main{i}.go").write_text("")
+    assert ProjectDetector(tmp_path).detect()["languages"] == ["go"]
+
+def test_detect_project_reuses_saved_profile(project_dir: Path, tmp_path_factory):
+    bootstrap = Bootstrap(target_dir=str(project_dir))
+    bootstrap.config_file = tmp_path_factory.mktemp("data") / "project_config.json"
+    profile = bootstrap._detect_project()
+    bootstrap._save_config(profile)
+    with patch.object(ProjectDetector, "detect", side_effect=AssertionError("should not re-detect")):
+        assert bootstrap._detect_project()["file_count"] == profile["file_count"]
+    (project_dir / "package.json").write_text("{}")
+    assert "javascript" in bootstrap._detect_project()["languages"]
+
+def test_detect_frameworks_from_package_json(tmp_path: Path):
+    (tmp_path / "package.json").write_text('{"dependencies": {"vue": "^3"}, "devDependencies": {"next": "14"}}')
+    assert ProjectDetector(tmp_path).detect()["frameworks"] == ["vue", "nextjs"]
+
+def test_manifest_language_detection_skips_deep_walk(project_dir: Path):
+    detector = ProjectDetector(project_dir)
+    assert detector._detect_languages() == ["python"]
+    assert detector._scan_result.deep is False
+    assert detector._scan_result.ext_counts == {}
+
+def test_ensure_directories(tmp_path: Path):
+    bootstrap = Bootstrap()
+    bootstrap.data_dir = tmp_path / "data"
+    (bootstrap.data_dir / "logs").mkdir(parents=True)
+    bootstrap._ensure_directories()
+    assert {p.name for p in bootstrap.data_dir.iterdir()} == Bootstrap.DATA_SUBDIRS
+
+def test_wait_for_index_joins_background_thread():
+    bootstrap = Bootstrap()
+    bootstrap.index_thread = MagicMock()
+    thread = bootstrap.index_thread
+    bootstrap.wait_for_index()
+    thread.join.assert_called_once_with()
+    assert bootstrap.index_thread is None
+    bootstrap.wait_for_index()
@@ -0,0 +1,21 @@
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import skyproject.cli as cli
+
+RUN_PY = Path(__file__).parent.parent / "run.py"
+
+def test_cli_module_is_unique():
+    spec = importlib.util.find_spec("skyproject.cli")
+    assert spec is not None and spec.origin == cli.__file__
+    assert callable(cli.main)
+
+def test_run_py_reuses_cli_cycle_runner():
+    assert "async def _run_n_cycles" not in RUN_PY.read_text()
+
+def test_cmd_init_waits_for_background_index():
+    with patch("skyproject.core.bootstrap.Bootstrap") as bootstrap_cls:
+        cli._cmd_init(None)
+    bootstrap_cls.return_value.run.assert_called_once_with()
+    bootstrap_cls.return_value.wait_for_index.assert_called_once_with()
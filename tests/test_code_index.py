@@ -0,0 +1,84 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from skyproject.core.code_index import CodeIndex
+from skyproject.shared.vector_store import SearchResult
+
+
+@pytest.fixture
+def code_index(tmp_path):
+    with patch("skyproject.core.code_index.CodeVectorStore") as store_cls, \
+            patch("skyproject.core.code_index.INDEX_READY_MARKER", tmp_path / ".index_ready"):
+        store = store_cls.return_value
+        store.count = 10
+        hit = SearchResult(content="def f(): pass", file_path="skyproject/core/a.py", name="f")
+        store.search_many.side_effect = lambda queries, **kwargs: [[hit] for _ in queries]
+        store.index_chunks.return_value = 1
+        index = CodeIndex()
+        index._indexed = True
+        yield index
+
+
+def test_get_context_for_task_is_cached(code_index):
+    first = code_index.get_context_for_task("refactor f")
+    second = code_index.get_context_for_task("refactor f")
+    assert first == second
+    assert "def f(): pass" in first
+    assert code_index.store.search_many.call_count == 1
+
+
+def test_index_file_invalidates_context_cache(code_index):
+    code_index.get_context_for_task("refactor f")
+    code_index.index_file("skyproject/core/a.py", "def f():\n    return 1\n")
+    code_index.get_context_for_task("refactor f")
+    assert code_index.store.search_many.call_count == 2
+
+
+def test_get_contexts_for_tasks_batches_cache_misses(code_index):
+    code_index.get_context_for_task("area one", module="irgat_ai")
+    contexts = code_index.get_contexts_for_tasks(["area one", "area two", "area three"], module="irgat_ai")
+    assert len(contexts) == 3
+    assert all("def f(): pass" in ctx for ctx in contexts)
+    code_index.store.search_many.assert_called_with(
+        ["area two", "area three"], n_results=15, module_filter="irgat_ai"
+    )
+    assert code_index.store.search_many.call_count == 2
+
+
+def test_index_files_submits_one_batch(code_index):
+    with patch.object(code_index.chunker, "chunk_file", side_effect=lambda path, content: [path]):
+        assert code_index.index_files([("a.py", "x = 1\n"), ("b.py", "y = 2\n")]) == 1
+    assert code_index.store.remove_file.call_count == 2
+    code_index.store.index_chunks.assert_called_once_with(["a.py", "b.py"], max_batch=256)
+
+
+def test_index_all_submits_one_batch(code_index):
+    with patch.object(code_index, "_chunk_modules", return_value=["a", "b"]):
+        code_index.index_all(max_batch=64)
+    code_index.store.index_chunks.assert_called_once_with(["a", "b"], max_batch=64)
+
+
+def test_reindex_changed_since_only_touches_newer_files(tmp_path):
+    core = tmp_path / "skyproject" / "core"
+    (core / "__pycache__").mkdir(parents=True)
+    (core / "old.py").write_text("def old(): pass\n")
+    (core / "new.py").write_text("def new(): pass\n")
+    (core / "__pycache__" / "new.py").write_text("")
+    os.utime(core / "old.py", (100, 100))
+    os.utime(core / "new.py", (300, 300))
+    marker = tmp_path / ".index_ready"
+    with patch("skyproject.core.code_index.CodeVectorStore") as store_cls, \
+            patch("skyproject.core.code_index.INDEX_READY_MARKER", marker):
+        store_cls.return_value.index_chunks.return_value = 1
+        index = CodeIndex(project_root=tmp_path)
+        assert index.last_indexed_at() == 0.0
+        marker.touch()
+        os.utime(marker, (50, 50))
+        assert index.last_indexed_at() == 50
+        assert index.reindex_changed_since(200) == 1
+        index.store.remove_file.assert_called_once_with(os.path.join("skyproject", "core", "new.py"))
+        assert index.last_indexed_at() > 300
+        assert index.reindex_changed_since(400) == 0
+        assert index.store.index_chunks.call_count == 1
@@ -1,12 +1,19 @@
-import pytest
 import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from skyproject.core import communication
 from skyproject.core.communication import MessageBus
 from skyproject.shared.models import Message
 
+
 @pytest.fixture
 def message_bus() -> MessageBus:
     return MessageBus()
 
+
 @pytest.fixture
 def sample_message() -> Message:
     return Message(
@@ -16,6 +23,7 @@ def sample_message() -> Message:
         payload={"task_id": "123", "description": "Test task"}
     )
 
+
 @pytest.mark.asyncio
 async def test_send_and_receive_message(message_bus: MessageBus, sample_message: Message):
     await message_bus.send(sample_message)
@@ -23,11 +31,39 @@ async def test_send_and_receive_message(message_bus: MessageBus, sample_message:
     assert received_message is not None
     assert received_message.id == sample_message.id
 
+
+@pytest.mark.asyncio
+async def test_send_many_delivers_in_order(message_bus: MessageBus):
+    messages = [
+        Message(sender="irgat", receiver="pm", msg_type="status_update", payload={"n": n})
+        for n in range(3)
+    ]
+    await message_bus.send_many(messages)
+    received = await message_bus.receive_all("pm")
+    assert [m.id for m in received] == [m.id for m in messages]
+
+
+@pytest.mark.asyncio
+async def test_send_many_logs_the_batch_in_one_write(message_bus: MessageBus, tmp_path):
+    message_bus._log_file = tmp_path / "messages.jsonl"
+    messages = [
+        Message(sender="irgat", receiver="pm", msg_type="status_update", payload={"n": n})
+        for n in range(3)
+    ]
+    with patch("skyproject.core.communication._write_all", wraps=communication._write_all) as write_all:
+        await message_bus.send_many(messages)
+    assert write_all.call_count == 1
+    lines = message_bus._log_file.read_bytes().splitlines()
+    assert [orjson.loads(line)["id"] for line in lines] == [m.id for m in messages]
+    assert [m.id for m in message_bus.get_history()] == [m.id for m in messages]
+
+
 @pytest.mark.asyncio
 async def test_receive_timeout(message_bus: MessageBus):
     received_message = await message_bus.receive("irgat", timeout=1.0)
     assert received_message is None
 
+
 @pytest.mark.asyncio
 async def test_subscribe_and_handler_execution(message_bus: MessageBus, sample_message: Message):
     handler_executed = False
@@ -41,6 +77,7 @@ async def test_subscribe_and_handler_execution(message_bus: MessageBus, sample_m
     await asyncio.sleep(0.1)  # Give the handler time to execute
     assert handler_executed
 
+
 @pytest.mark.asyncio
 async def test_receive_all_messages(message_bus: MessageBus, sample_message: Message):
     await message_bus.send(sample_message)
@@ -48,9 +85,154 @@ async def test_receive_all_messages(message_bus: MessageBus, sample_message: Mes
     messages = await message_bus.receive_all("irgat")
     assert len(messages) == 2
 
+
 @pytest.mark.asyncio
 async def test_message_history(message_bus: MessageBus, sample_message: Message):
     await message_bus.send(sample_message)
     history = message_bus.get_history()
     assert len(history) == 1
-    assert history[0].id == sample_message.id
\ No newline at end of file
+    assert history[0].id == sample_message.id
+
+
+@pytest.mark.asyncio
+async def test_message_log_is_buffered_until_flush(message_bus: MessageBus, sample_message: Message, tmp_path):
+    message_bus._log_file = tmp_path / "messages.jsonl"
+    await message_bus.send(sample_message)
+    await message_bus.send(sample_message)
+    assert not message_bus._log_file.exists()
+    await message_bus.close()
+    lines = message_bus._log_file.read_bytes().splitlines()
+    assert len(lines) == 2
+    assert orjson.loads(lines[0])["id"] == sample_message.id
+
+
+@pytest.mark.asyncio
+async def test_send_reliable_resolves_on_receive(message_bus: MessageBus, sample_message: Message):
+    pending = asyncio.create_task(message_bus.send_reliable(sample_message))
+    await message_bus.receive("irgat")
+    assert await asyncio.wait_for(pending, timeout=1.0) is True
+    assert message_bus._acknowledgments == {}
+    await message_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_send_reliable_gives_up_after_retries(message_bus: MessageBus, sample_message: Message):
+    with patch("skyproject.core.communication.ACK_TIMEOUT", 0.01), \
+         patch("skyproject.core.communication.ACK_WHEEL_TICK", 0.01), \
+         patch.object(communication.Config, "MAX_RETRIES", 1):
+        assert await asyncio.wait_for(message_bus.send_reliable(sample_message), timeout=1.0) is False
+    assert message_bus._acknowledgments == {}
+    await message_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_inline_and_failures_are_isolated(message_bus: MessageBus, sample_message: Message):
+    seen = []
+
+    async def failing(message: Message):
+        raise RuntimeError("boom")
+
+    async def recording(message: Message):
+        seen.append("async")
+
+    message_bus.subscribe("task_assign", lambda m: seen.append("sync"))
+    message_bus.subscribe("task_assign", failing)
+    message_bus.subscribe("task_assign", recording)
+    await message_bus.send(sample_message)
+    assert seen == ["sync"]
+    await asyncio.sleep(0.05)
+    assert seen == ["sync", "async"]
+    await message_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_message_history_is_bounded(sample_message: Message):
+    with patch.object(communication.Config, "MAX_HISTORY", 3):
+        bus = MessageBus()
+    messages = [sample_message.model_copy(update={"id": str(i)}) for i in range(5)]
+    for message in messages:
+        await bus.send(message)
+    assert [m.id for m in bus.get_history()] == ["2", "3", "4"]
+    assert [m.id for m in bus.get_history(limit=2)] == ["3", "4"]
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_backpressured_send_wakes_when_consumer_drains(sample_message: Message):
+    with patch.object(communication.Config, "MAX_QUEUE_SIZE", 1):
+        bus = MessageBus()
+    await bus.send(sample_message)
+    blocked = asyncio.create_task(bus.send(sample_message.model_copy(update={"id": "second"})))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert (await bus.receive("irgat")).id == sample_message.id
+    await asyncio.wait_for(blocked, timeout=0.2)
+    assert (await bus.receive("irgat")).id == "second"
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_batched_flushes_by_size_and_delay(message_bus: MessageBus, sample_message: Message):
+    batches = []
+
+    async def handler(messages):
+        batches.append([m.id for m in messages])
+
+    message_bus.subscribe_batched("task_assign", handler, max_batch=2, max_delay_ms=10)
+    for i in range(3):
+        await message_bus.send(sample_message.model_copy(update={"id": str(i)}))
+    await asyncio.sleep(0)
+    assert batches == [["0", "1"]]
+    await asyncio.sleep(0.05)
+    assert batches == [["0", "1"], ["2"]]
+    await message_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_message_is_serialized_once(message_bus: MessageBus, sample_message: Message):
+    wire = sample_message.to_wire()
+    assert sample_message.to_wire() is wire
+    assert orjson.loads(wire)["id"] == sample_message.id
+    assert orjson.loads(sample_message.model_copy(update={"id": "copy"}).to_wire())["id"] == "copy"
+    assert orjson.loads(sample_message.model_copy(update={"payload": {1: "a"}}).to_wire())["payload"] == {"1": "a"}
+    await message_bus.send(sample_message)
+    assert message_bus._log_buffer == [wire]
+    await message_bus.close()
+
+
+def test_queue_average_load_uses_rolling_window():
+    queue = communication.ResizableQueue(maxsize=10)
+    assert queue.average_load() == 0
+    for load in range(queue.LOAD_WINDOW + 10):
+        queue.record_load(load)
+    assert queue.average_load() == sum(range(10, queue.LOAD_WINDOW + 10)) / queue.LOAD_WINDOW
+
+
+@pytest.mark.asyncio
+async def test_ack_wheel_fires_after_whole_rounds(message_bus: MessageBus, sample_message: Message):
+    fired = []
+    message_bus._on_ack_timer = lambda is_resend, message, attempt: fired.append(attempt)
+    message_bus._schedule_ack_timer(communication.ACK_WHEEL_SLOTS + 2, False, sample_message, 7)
+    for _ in range(communication.ACK_WHEEL_SLOTS + 1):
+        message_bus._advance_ack_wheel()
+    assert fired == []
+    message_bus._advance_ack_wheel()
+    assert fired == [7]
+    assert message_bus._ack_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_retransmission_skips_pipeline_and_is_dropped_on_receive(
+    message_bus: MessageBus, sample_message: Message
+):
+    handled = []
+    message_bus.subscribe("task_assign", handled.append)
+    await message_bus.send(sample_message)
+    await message_bus._send(sample_message, attempt=1)
+    assert len(handled) == 1
+    assert len(message_bus.get_history()) == 1
+    assert len(message_bus._log_buffer) == 1
+    assert (await message_bus.receive("irgat")).id == sample_message.id
+    assert await message_bus.receive("irgat", timeout=0.05) is None
+    assert message_bus._retransmits == {}
+    await message_bus.close()
@@ -0,0 +1,65 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skyproject.irgat_ai.executor import Executor
+from skyproject.shared.models import CodeChange, Task, TaskStatus, TaskType
+
+
+@pytest.mark.asyncio
+async def test_execute_task_uses_prefetched_prompt():
+    llm = MagicMock()
+    llm.generate_json = AsyncMock(return_value={
+        "changes": [{"file_path": "skyproject/example.py", "new_content": "x = 1\n"}]
+    })
+    executor = Executor(llm)
+    executor.tester.validate_changes = AsyncMock(return_value=True)
+    task = Task(title="Add x", description="Define x", task_type=TaskType.FEATURE)
+
+    with patch.object(executor.coder, "build_prompt", AsyncMock(return_value="prebuilt")) as build_prompt, \
+         patch("skyproject.irgat_ai.executor.write_file", AsyncMock()):
+        executor.prefetch_prompt(task)
+        result = await executor.execute_task(task)
+
+    build_prompt.assert_awaited_once_with(task)
+    assert llm.generate_json.await_args.args[1] == "prebuilt"
+    assert result.status == TaskStatus.IN_REVIEW
+    assert executor._prompts == {}
+
+
+@pytest.mark.asyncio
+async def test_write_changes_writes_each_path_once():
+    executor = Executor(MagicMock())
+    changes = [
+        CodeChange(file_path="a.py", new_content="old"),
+        CodeChange(file_path="b.py", new_content="b"),
+        CodeChange(file_path="a.py", new_content="new"),
+    ]
+
+    with patch("skyproject.irgat_ai.executor.write_file", AsyncMock()) as write_file:
+        await executor._write_changes(changes)
+
+    assert sorted(call.args for call in write_file.await_args_list) == [("a.py", "new"), ("b.py", "b")]
+
+
+@pytest.mark.asyncio
+async def test_cancel_prefetched_drops_unused_prompts():
+    executor = Executor(MagicMock())
+    task = Task(title="Add x", description="Define x", task_type=TaskType.FEATURE)
+    started = asyncio.Event()
+
+    async def slow_prompt(_task):
+        started.set()
+        await asyncio.sleep(10)
+
+    with patch.object(executor.coder, "build_prompt", slow_prompt):
+        executor.prefetch_prompt(task)
+        executor.prefetch_prompt(None)
+        pending = executor._prompts[task.id]
+        await started.wait()
+        executor.cancel_prefetched()
+
+    assert executor._prompts == {}
+    with pytest.raises(asyncio.CancelledError):
+        await pending
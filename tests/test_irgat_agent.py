@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skyproject.irgat_ai.irgat_agent import IrgatAIAgent
+from skyproject.shared.models import CodeChange, Message, Task, TaskStatus, TaskType
+
+
+def _assign(title: str) -> Message:
+    task = Task(title=title, description=title, task_type=TaskType.FEATURE)
+    return Message(sender="pm", receiver="irgat", msg_type="task_assign", payload=task.model_dump(mode="json"))
+
+
+@pytest.mark.asyncio
+async def test_next_prompt_is_prefetched_after_changes_are_indexed():
+    bus = MagicMock()
+    first, second = _assign("first"), _assign("second")
+    bus.receive_all = AsyncMock(return_value=[first, second])
+    bus.send_many = AsyncMock()
+    code_index = MagicMock()
+    agent = IrgatAIAgent(bus, MagicMock(save=AsyncMock()), code_index=code_index)
+    events = []
+
+    async def execute(task):
+        events.append(("execute", task.title))
+        task.code_changes = [CodeChange(file_path=f"{task.title}.py", new_content="x = 1\n")]
+        task.status = TaskStatus.IN_REVIEW
+        return task
+
+    code_index.index_files.side_effect = lambda files: events.append(("index", files[0][0]))
+    with patch.object(agent.executor, "execute_task", side_effect=execute), \
+         patch.object(agent.executor, "prefetch_prompt",
+                      side_effect=lambda t: events.append(("prefetch", t and t.title))):
+        await agent.run_cycle()
+
+    assert events == [
+        ("execute", "first"), ("index", "first.py"), ("prefetch", "second"),
+        ("execute", "second"), ("index", "second.py"), ("prefetch", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_leftover_prefetch_is_cancelled_when_a_message_fails():
+    bus = MagicMock()
+    bus.receive_all = AsyncMock(return_value=[_assign("first"), _assign("second")])
+    agent = IrgatAIAgent(bus, MagicMock(save=AsyncMock(side_effect=OSError("disk full"))))
+
+    with patch.object(agent.executor.coder, "build_prompt", AsyncMock(return_value="prompt")), \
+         patch.object(agent.executor, "execute_task", AsyncMock(side_effect=lambda t: t)):
+        with pytest.raises(OSError):
+            await agent.run_cycle()
+
+    assert agent.executor._prompts == {}
+    assert agent._next_task is None
@@ -0,0 +1,31 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from skyproject.shared.llm_client import LLMClient
+
+
+def test_clients_share_one_sdk_client_per_provider():
+    with patch("openai.OpenAI") as mock_openai, patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}):
+        first = LLMClient(provider="openai")._get_openai_client()
+        second = LLMClient(provider="openai")._get_openai_client()
+
+    assert first is second
+    mock_openai.assert_called_once_with(api_key="sk-test")
+
+
+@pytest.mark.asyncio
+async def test_anthropic_marks_system_and_prefix_for_caching():
+    with patch("anthropic.Anthropic") as mock_anthropic:
+        create = mock_anthropic.return_value.messages.create
+        create.return_value = MagicMock(content=[MagicMock(text='{"ok": true}')])
+        client = LLMClient(provider="anthropic")
+        result = await client.generate_json("system", "dynamic part", cached_prefix="stable part")
+
+    assert result == {"ok": True}
+    kwargs = create.call_args.kwargs
+    assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    prefix, suffix = kwargs["messages"][0]["content"]
+    assert prefix["text"].endswith("stable part")
+    assert prefix["cache_control"] == {"type": "ephemeral"}
+    assert suffix == {"type": "text", "text": "dynamic part"}
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+from unittest.mock import patch
 from pathlib import Path
 from skyproject.core.task_store import TaskStore
 from skyproject.shared.models import Task, TaskStatus, TaskType, TaskPriority
@@ -58,4 +59,128 @@ async def test_count_by_status(task_store: TaskStore, sample_task: Task):
     await task_store.save(sample_task)
     counts = await task_store.count_by_status()
     assert counts[TaskStatus.PENDING.value] == 1
-    assert counts[TaskStatus.IN_PROGRESS.value] == 0
\ No newline at end of file
+    assert counts[TaskStatus.IN_PROGRESS.value] == 0
+
+@pytest.mark.asyncio
+async def test_get_all_reparses_only_changed_files(task_store: TaskStore, sample_task: Task):
+    await task_store.save(sample_task)
+    with patch("skyproject.core.task_store._read_file", side_effect=AssertionError("should use cache")):
+        assert (await task_store.get_all())[0] == sample_task
+
+    path = task_store.store_dir / f"{sample_task.id}.json"
+    path.write_text(sample_task.model_copy(update={"title": "Edited elsewhere"}).model_dump_json())
+    assert (await task_store.get_all())[0].title == "Edited elsewhere"
+
+    path.unlink()
+    assert await task_store.get_all() == []
+    assert task_store._cache == {}
+
+
+@pytest.mark.asyncio
+async def test_status_index_tracks_saves(task_store: TaskStore, sample_task: Task):
+    await task_store.save(sample_task)
+    assert (await task_store.count_by_status())[TaskStatus.PENDING.value] == 1
+
+    sample_task.status = TaskStatus.COMPLETED
+    await task_store.save(sample_task)
+    with patch.object(task_store, "get_all", side_effect=AssertionError("should use the index")):
+        counts = await task_store.count_by_status()
+        assert counts[TaskStatus.PENDING.value] == 0
+        assert counts[TaskStatus.COMPLETED.value] == 1
+        assert await task_store.count_status(TaskStatus.COMPLETED) == 1
+        assert await task_store.get_pending() == []
+        assert [t.id for t in await task_store.get_completed()] == [sample_task.id]
+
+
+@pytest.mark.asyncio
+async def test_update_status_marks_store_dirty(task_store: TaskStore, sample_task: Task):
+    await task_store.save(sample_task)
+    assert task_store.consume_dirty() is True
+    assert task_store.consume_dirty() is False
+    await task_store.update_status(sample_task.id, TaskStatus.COMPLETED)
+    assert task_store.consume_dirty() is True
+
+
+@pytest.mark.asyncio
+async def test_cached_tasks_are_not_shared_with_callers(task_store: TaskStore, sample_task: Task):
+    await task_store.save(sample_task)
+    sample_task.status = TaskStatus.FAILED
+    loaded = await task_store.load(sample_task.id)
+    assert loaded.status == TaskStatus.PENDING
+    loaded.status = TaskStatus.IN_PROGRESS
+    assert (await task_store.get_all())[0].status == TaskStatus.PENDING
+
+    with patch("skyproject.core.task_store._atomic_write", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            await task_store.update_status(sample_task.id, TaskStatus.COMPLETED)
+    assert (await task_store.count_by_status())[TaskStatus.PENDING.value] == 1
+    assert (await task_store.load(sample_task.id)).status == TaskStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_update_status_skips_unchanged_status(task_store: TaskStore, sample_task: Task):
+    await task_store.save(sample_task)
+    with patch.object(task_store, "_read_from_file", side_effect=AssertionError("should use cache")), \
+            patch("skyproject.core.task_store._atomic_write", side_effect=AssertionError("should not rewrite")):
+        assert (await task_store.update_status(sample_task.id, TaskStatus.PENDING)).status == TaskStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_get_all_reads_stale_files_in_one_thread_hop(task_store: TaskStore, sample_task: Task):
+    for i in range(3):
+        await task_store.save(sample_task.model_copy(update={"id": f"t{i}"}))
+    fresh = TaskStore(store_dir=task_store.store_dir)
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        assert [t.id for t in await fresh.get_all()] == ["t0", "t1", "t2"]
+    assert to_thread.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_coalesced_into_one_write_job(task_store: TaskStore, sample_task: Task):
+    tasks = [sample_task.model_copy(update={"id": f"t{i}"}) for i in range(3)]
+    renamed = sample_task.model_copy(update={"id": "t0", "title": "Latest"})
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        await asyncio.gather(*(task_store.save(t) for t in tasks), task_store.save(renamed))
+    assert to_thread.call_count == 1
+    assert (await task_store.load("t0")).title == "Latest"
+    assert len(await TaskStore(store_dir=task_store.store_dir).get_all()) == 3
+
+
+@pytest.mark.asyncio
+async def test_reads_from_another_thread_while_saving(task_store: TaskStore, sample_task: Task):
+    # The web UI runs its own event loop in a thread and reads through the same store
+    errors = []
+
+    def read_from_web_thread():
+        async def read():
+            for _ in range(50):
+                await task_store.count_by_status()
+                await task_store.get_pending()
+        try:
+            asyncio.run(read())
+        except Exception as e:
+            errors.append(e)
+
+    reader = asyncio.create_task(asyncio.to_thread(read_from_web_thread))
+    for i in range(50):
+        await task_store.save(sample_task.model_copy(update={"id": f"t{i}"}))
+    await reader
+    assert errors == []
+    assert (await task_store.count_by_status())[TaskStatus.PENDING.value] == 50
+
+
+@pytest.mark.asyncio
+async def test_status_queries_see_external_changes(task_store: TaskStore, sample_task: Task):
+    await task_store.save(sample_task)
+    assert await task_store.count_status(TaskStatus.PENDING) == 1
+
+    # Another process adds a task and finishes the first one
+    other = sample_task.model_copy(update={"id": "external"})
+    (task_store.store_dir / "external.json").write_text(other.model_dump_json())
+    path = task_store.store_dir / f"{sample_task.id}.json"
+    path.write_text(sample_task.model_copy(update={"status": TaskStatus.COMPLETED, "title": "x"}).model_dump_json())
+    assert [t.id for t in await task_store.get_pending()] == ["external"]
+    assert (await task_store.count_by_status())[TaskStatus.COMPLETED.value] == 1
+
+    path.unlink()
+    assert await task_store.count_status(TaskStatus.COMPLETED) == 0